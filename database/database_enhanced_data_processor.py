@@ -23,8 +23,9 @@ from .database_models import BoxScore
 class DatabaseBoxScoreLoader:
     """Load box score data from database instead of CSV files"""
     
-    def __init__(self):
+    def __init__(self, data_dir: str = "data"):
         self.db_manager = DatabaseManager()
+        self.data_dir = data_dir  # Cache directory for the box score Parquet copies
     
     def load_week_data_from_db(self, week: int) -> pd.DataFrame:
         """Load box score data for a specific week from the database"""
@@ -106,8 +107,7 @@ class DatabaseBoxScoreLoader:
                     pivot_df = pivot_df[required_columns]
                     
                     # Add Name_clean column for matching (required by get_actual_stat function)
-                    from utils import clean_player_name
-                    pivot_df['Name_clean'] = pivot_df['Name'].apply(clean_player_name)
+                    pivot_df['Name_clean'] = pivot_df['Name'].map(clean_player_name)
                     
                     print(f"✅ Converted to DataFrame with {len(pivot_df)} players")
                     return pivot_df
@@ -138,15 +138,12 @@ class DatabaseBoxScoreLoader:
             
             if os.path.exists(box_score_file):
                 # Load CSV to get team information
-                csv_df = pd.read_csv(box_score_file)
+                csv_df = EnhancedFootballDataProcessor._read_box_score_csv(
+                    box_score_file, columns=['Name', 'team'], data_dir=self.data_dir)
                 
                 # Create a mapping from cleaned player name to team
-                team_mapping = {}
-                for _, row in csv_df.iterrows():
-                    player_name = row['Name']
-                    cleaned_name = clean_player_name(player_name)
-                    team = row['team']
-                    team_mapping[cleaned_name] = team
+                cleaned_names = csv_df['Name'].map(clean_player_name)
+                team_mapping = dict(zip(cleaned_names, csv_df['team']))
                 
                 # Map each player to their team using cleaned names
                 teams = []
@@ -178,7 +175,7 @@ class DatabaseEnhancedFootballDataProcessor(EnhancedFootballDataProcessor):
     def __init__(self, data_dir: str = "data", max_week: int = None, skip_calculations: bool = False):
         self.use_database = True  # Always use database now
         self.skip_calculations = skip_calculations
-        self.db_loader = DatabaseBoxScoreLoader()  # Always use database loader
+        self.db_loader = DatabaseBoxScoreLoader(data_dir)  # Always use database loader
         
         if skip_calculations:
             # Custom initialization that skips expensive calculations
@@ -187,6 +184,7 @@ class DatabaseEnhancedFootballDataProcessor(EnhancedFootballDataProcessor):
             self.historical_defensive_stats = {}
             self.player_season_stats = {}
             self.player_name_index = {}
+            self._reset_lookup_caches()
             self.current_week = self._get_current_week()
             self.max_week = max_week
             self.schedule_data = self._load_schedule()
@@ -250,7 +248,7 @@ class DatabaseEnhancedFootballDataProcessor(EnhancedFootballDataProcessor):
             if os.path.exists(box_score_file):
                 print(f"📊 Loading existing box score data from {box_score_file}")
                 # Load the existing CSV data
-                master_df = pd.read_csv(box_score_file)
+                master_df = self._read_box_score_csv(box_score_file, data_dir=self.data_dir)
                 
                 if master_df.empty:
                     print(f"⚠️ No data found in {box_score_file}")
@@ -278,12 +276,7 @@ class DatabaseEnhancedFootballDataProcessor(EnhancedFootballDataProcessor):
                 return []
         else:
             # Fallback to file system check
-            available_weeks = []
-            for week in range(1, 8):  # Check weeks 1-7
-                box_score_file = f"2025/WEEK{week}/box_score_debug.csv"
-                if os.path.exists(box_score_file):
-                    available_weeks.append(week)
-            return available_weeks
+            return list(self._discover_box_score_weeks())
     
     def close(self):
         """Close database connections"""
@@ -5,8 +5,9 @@ Run this weekly to update defensive stats for the prop optimizer
 """
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
+import numpy as np
 import json
 import pickle
 import time
@@ -15,6 +16,98 @@ from typing import Dict, List, Optional
 from datetime import datetime
 from utils import normalize_team_name
 
+# lxml is optional - it parses the stats pages much faster than the built-in parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# requests-cache is optional - with it, NFL.com pages are cached on disk for an hour and
+# revalidated with ETag/Last-Modified afterwards, so repeat scrapes get 304s
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# orjson is optional - it reads and writes the rankings JSON cache faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_HTTP_CACHE_NAME = "data/http_cache"
+_HTTP_CACHE_EXPIRE_SECONDS = 3600
+
+# Only the NFL.com stats table is used, so skip building the rest of the page. Strain on
+# the tag alone: the table carries several classes, which a class filter here won't match.
+_NFL_STATS_TABLE = SoupStrainer('table')
+
+# Manual ESPN defensive statistics (accurate as of week data was collected).
+# Update this periodically or implement live scraping. Built once at import with
+# normalized team names; shared by every DefensiveScraper - treat it as read-only.
+_ESPN_DEFENSIVE_STATS = {normalize_team_name(team): stats for team, stats in {
+    'Atlanta Falcons': {'total_yards_per_game': 244.0, 'passing_yards_per_game': 135.0, 'rushing_yards_per_game': 109.0, 'points_allowed_per_game': 21.5},
+    'Cleveland Browns': {'total_yards_per_game': 247.8, 'passing_yards_per_game': 172.2, 'rushing_yards_per_game': 75.6, 'points_allowed_per_game': 24.6},
+    'Houston Texans': {'total_yards_per_game': 265.8, 'passing_yards_per_game': 175.2, 'rushing_yards_per_game': 90.6, 'points_allowed_per_game': 12.2},
+    'Green Bay Packers': {'total_yards_per_game': 283.3, 'passing_yards_per_game': 205.8, 'rushing_yards_per_game': 77.5, 'points_allowed_per_game': 21.0},
+    'Denver Broncos': {'total_yards_per_game': 288.6, 'passing_yards_per_game': 200.2, 'rushing_yards_per_game': 88.4, 'points_allowed_per_game': 16.8},
+    'Minnesota Vikings': {'total_yards_per_game': 289.8, 'passing_yards_per_game': 157.6, 'rushing_yards_per_game': 132.2, 'points_allowed_per_game': 19.4},
+    'Los Angeles Chargers': {'total_yards_per_game': 293.8, 'passing_yards_per_game': 172.2, 'rushing_yards_per_game': 121.6, 'points_allowed_per_game': 19.6},
+    'Detroit Lions': {'total_yards_per_game': 298.8, 'passing_yards_per_game': 206.6, 'rushing_yards_per_game': 92.2, 'points_allowed_per_game': 22.4},
+    'Buffalo Bills': {'total_yards_per_game': 299.6, 'passing_yards_per_game': 154.0, 'rushing_yards_per_game': 145.6, 'points_allowed_per_game': 22.6},
+    'Los Angeles Rams': {'total_yards_per_game': 309.0, 'passing_yards_per_game': 215.4, 'rushing_yards_per_game': 93.6, 'points_allowed_per_game': 21.4},
+    'Tampa Bay Buccaneers': {'total_yards_per_game': 310.8, 'passing_yards_per_game': 218.4, 'rushing_yards_per_game': 92.4, 'points_allowed_per_game': 26.4},
+    'Carolina Panthers': {'total_yards_per_game': 311.6, 'passing_yards_per_game': 204.4, 'rushing_yards_per_game': 107.2, 'points_allowed_per_game': 23.8},
+    'Kansas City Chiefs': {'total_yards_per_game': 314.0, 'passing_yards_per_game': 190.6, 'rushing_yards_per_game': 123.4, 'points_allowed_per_game': 21.4},
+    'Indianapolis Colts': {'total_yards_per_game': 315.0, 'passing_yards_per_game': 217.0, 'rushing_yards_per_game': 98.0, 'points_allowed_per_game': 17.8},
+    'San Francisco 49ers': {'total_yards_per_game': 315.6, 'passing_yards_per_game': 207.6, 'rushing_yards_per_game': 108.0, 'points_allowed_per_game': 19.6},
+    'Seattle Seahawks': {'total_yards_per_game': 322.8, 'passing_yards_per_game': 239.8, 'rushing_yards_per_game': 83.0, 'points_allowed_per_game': 21.0},
+    'New Orleans Saints': {'total_yards_per_game': 326.2, 'passing_yards_per_game': 204.0, 'rushing_yards_per_game': 122.2, 'points_allowed_per_game': 27.0},
+    'New England Patriots': {'total_yards_per_game': 327.8, 'passing_yards_per_game': 242.2, 'rushing_yards_per_game': 85.6, 'points_allowed_per_game': 20.2},
+    'Las Vegas Raiders': {'total_yards_per_game': 328.2, 'passing_yards_per_game': 226.8, 'rushing_yards_per_game': 101.4, 'points_allowed_per_game': 27.8},
+    'Philadelphia Eagles': {'total_yards_per_game': 338.2, 'passing_yards_per_game': 211.4, 'rushing_yards_per_game': 126.8, 'points_allowed_per_game': 21.8},
+    'Arizona Cardinals': {'total_yards_per_game': 346.6, 'passing_yards_per_game': 254.2, 'rushing_yards_per_game': 92.4, 'points_allowed_per_game': 19.2},
+    'New York Jets': {'total_yards_per_game': 347.4, 'passing_yards_per_game': 207.0, 'rushing_yards_per_game': 140.4, 'points_allowed_per_game': 31.4},
+    'Jacksonville Jaguars': {'total_yards_per_game': 348.2, 'passing_yards_per_game': 250.4, 'rushing_yards_per_game': 97.8, 'points_allowed_per_game': 20.0},
+    'Washington Commanders': {'total_yards_per_game': 352.0, 'passing_yards_per_game': 235.0, 'rushing_yards_per_game': 117.0, 'points_allowed_per_game': 20.2},
+    'Tennessee Titans': {'total_yards_per_game': 366.8, 'passing_yards_per_game': 220.0, 'rushing_yards_per_game': 146.8, 'points_allowed_per_game': 28.2},
+    'New York Giants': {'total_yards_per_game': 377.2, 'passing_yards_per_game': 237.2, 'rushing_yards_per_game': 140.0, 'points_allowed_per_game': 25.4},
+    'Chicago Bears': {'total_yards_per_game': 379.5, 'passing_yards_per_game': 215.0, 'rushing_yards_per_game': 164.5, 'points_allowed_per_game': 29.3},
+    'Pittsburgh Steelers': {'total_yards_per_game': 382.5, 'passing_yards_per_game': 260.5, 'rushing_yards_per_game': 122.0, 'points_allowed_per_game': 24.5},
+    'Miami Dolphins': {'total_yards_per_game': 386.6, 'passing_yards_per_game': 212.4, 'rushing_yards_per_game': 174.2, 'points_allowed_per_game': 29.0},
+    'Cincinnati Bengals': {'total_yards_per_game': 391.2, 'passing_yards_per_game': 259.0, 'rushing_yards_per_game': 132.2, 'points_allowed_per_game': 31.2},
+    'Baltimore Ravens': {'total_yards_per_game': 408.8, 'passing_yards_per_game': 262.6, 'rushing_yards_per_game': 146.4, 'points_allowed_per_game': 35.4},
+    'Dallas Cowboys': {'total_yards_per_game': 412.0, 'passing_yards_per_game': 284.6, 'rushing_yards_per_game': 127.4, 'points_allowed_per_game': 30.8}
+}.items()}
+
+
+def _average_ranks(values: np.ndarray) -> np.ndarray:
+    """
+    Rank values ascending (smallest = 1), giving tied values their average rank
+    
+    Averages are rounded to the nearest whole number, halves to even like round().
+    
+    Args:
+        values: 1-D array of values to rank
+        
+    Returns:
+        Integer rank for each value, in the input order
+    """
+    order = np.argsort(values, kind='stable')
+    sorted_values = values[order]
+    # Start index of each run of equal values in sorted order, plus the end sentinel
+    starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    bounds = np.r_[starts, len(values)]
+    # A run covering sorted positions start..end-1 holds ranks start+1..end
+    run_ranks = np.round((bounds[:-1] + 1 + bounds[1:]) / 2).astype(int)
+    ranks = np.empty(len(values), dtype=int)
+    ranks[order] = np.repeat(run_ranks, np.diff(bounds))
+    return ranks
+
+
 class DefensiveScraper:
     """
     Unified defensive statistics scraper
@@ -31,6 +124,14 @@ class DefensiveScraper:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # One session for both NFL.com pages so the connection is reused
+        if REQUESTS_CACHE_AVAILABLE:
+            self.session = requests_cache.CachedSession(_HTTP_CACHE_NAME, backend='sqlite',
+                                                        expire_after=_HTTP_CACHE_EXPIRE_SECONDS,
+                                                        cache_control=True)
+        else:
+            self.session = requests.Session()
+        self.session.headers.update(self.headers)
     
     def scrape_nfl_td_stats(self) -> Dict[str, Dict[str, int]]:
         """Scrape TD statistics from NFL.com"""
@@ -63,10 +164,10 @@ class DefensiveScraper:
     def _scrape_nfl_passing_tds(self) -> Dict[str, Dict[str, int]]:
         """Scrape passing defense TD statistics from NFL.com"""
         try:
-            response = requests.get(self.nfl_urls['passing'], headers=self.headers, timeout=30)
+            response = self.session.get(self.nfl_urls['passing'], timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=_NFL_STATS_TABLE)
             table = soup.find('table', class_='d3-o-table')
             
             if not table:
@@ -98,10 +199,10 @@ class DefensiveScraper:
     def _scrape_nfl_rushing_tds(self) -> Dict[str, Dict[str, int]]:
         """Scrape rushing defense TD statistics from NFL.com"""
         try:
-            response = requests.get(self.nfl_urls['rushing'], headers=self.headers, timeout=30)
+            response = self.session.get(self.nfl_urls['rushing'], timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=_NFL_STATS_TABLE)
             table = soup.find('table', class_='d3-o-table')
             
             if not table:
@@ -154,53 +255,10 @@ class DefensiveScraper:
         """
         Get ESPN defensive statistics
         Note: Currently using manual data. Can be updated to scrape live ESPN data.
+        Returns the shared module-level table - callers must not mutate it.
         """
         print("🔄 Loading ESPN defensive statistics...")
-        
-        # Using manual ESPN data (accurate as of week data was collected)
-        # Update this periodically or implement live scraping
-        # All team names are normalized to ensure consistency
-        defensive_stats = {}
-        raw_stats = {
-            'Atlanta Falcons': {'total_yards_per_game': 244.0, 'passing_yards_per_game': 135.0, 'rushing_yards_per_game': 109.0, 'points_allowed_per_game': 21.5},
-            'Cleveland Browns': {'total_yards_per_game': 247.8, 'passing_yards_per_game': 172.2, 'rushing_yards_per_game': 75.6, 'points_allowed_per_game': 24.6},
-            'Houston Texans': {'total_yards_per_game': 265.8, 'passing_yards_per_game': 175.2, 'rushing_yards_per_game': 90.6, 'points_allowed_per_game': 12.2},
-            'Green Bay Packers': {'total_yards_per_game': 283.3, 'passing_yards_per_game': 205.8, 'rushing_yards_per_game': 77.5, 'points_allowed_per_game': 21.0},
-            'Denver Broncos': {'total_yards_per_game': 288.6, 'passing_yards_per_game': 200.2, 'rushing_yards_per_game': 88.4, 'points_allowed_per_game': 16.8},
-            'Minnesota Vikings': {'total_yards_per_game': 289.8, 'passing_yards_per_game': 157.6, 'rushing_yards_per_game': 132.2, 'points_allowed_per_game': 19.4},
-            'Los Angeles Chargers': {'total_yards_per_game': 293.8, 'passing_yards_per_game': 172.2, 'rushing_yards_per_game': 121.6, 'points_allowed_per_game': 19.6},
-            'Detroit Lions': {'total_yards_per_game': 298.8, 'passing_yards_per_game': 206.6, 'rushing_yards_per_game': 92.2, 'points_allowed_per_game': 22.4},
-            'Buffalo Bills': {'total_yards_per_game': 299.6, 'passing_yards_per_game': 154.0, 'rushing_yards_per_game': 145.6, 'points_allowed_per_game': 22.6},
-            'Los Angeles Rams': {'total_yards_per_game': 309.0, 'passing_yards_per_game': 215.4, 'rushing_yards_per_game': 93.6, 'points_allowed_per_game': 21.4},
-            'Tampa Bay Buccaneers': {'total_yards_per_game': 310.8, 'passing_yards_per_game': 218.4, 'rushing_yards_per_game': 92.4, 'points_allowed_per_game': 26.4},
-            'Carolina Panthers': {'total_yards_per_game': 311.6, 'passing_yards_per_game': 204.4, 'rushing_yards_per_game': 107.2, 'points_allowed_per_game': 23.8},
-            'Kansas City Chiefs': {'total_yards_per_game': 314.0, 'passing_yards_per_game': 190.6, 'rushing_yards_per_game': 123.4, 'points_allowed_per_game': 21.4},
-            'Indianapolis Colts': {'total_yards_per_game': 315.0, 'passing_yards_per_game': 217.0, 'rushing_yards_per_game': 98.0, 'points_allowed_per_game': 17.8},
-            'San Francisco 49ers': {'total_yards_per_game': 315.6, 'passing_yards_per_game': 207.6, 'rushing_yards_per_game': 108.0, 'points_allowed_per_game': 19.6},
-            'Seattle Seahawks': {'total_yards_per_game': 322.8, 'passing_yards_per_game': 239.8, 'rushing_yards_per_game': 83.0, 'points_allowed_per_game': 21.0},
-            'New Orleans Saints': {'total_yards_per_game': 326.2, 'passing_yards_per_game': 204.0, 'rushing_yards_per_game': 122.2, 'points_allowed_per_game': 27.0},
-            'New England Patriots': {'total_yards_per_game': 327.8, 'passing_yards_per_game': 242.2, 'rushing_yards_per_game': 85.6, 'points_allowed_per_game': 20.2},
-            'Las Vegas Raiders': {'total_yards_per_game': 328.2, 'passing_yards_per_game': 226.8, 'rushing_yards_per_game': 101.4, 'points_allowed_per_game': 27.8},
-            'Philadelphia Eagles': {'total_yards_per_game': 338.2, 'passing_yards_per_game': 211.4, 'rushing_yards_per_game': 126.8, 'points_allowed_per_game': 21.8},
-            'Arizona Cardinals': {'total_yards_per_game': 346.6, 'passing_yards_per_game': 254.2, 'rushing_yards_per_game': 92.4, 'points_allowed_per_game': 19.2},
-            'New York Jets': {'total_yards_per_game': 347.4, 'passing_yards_per_game': 207.0, 'rushing_yards_per_game': 140.4, 'points_allowed_per_game': 31.4},
-            'Jacksonville Jaguars': {'total_yards_per_game': 348.2, 'passing_yards_per_game': 250.4, 'rushing_yards_per_game': 97.8, 'points_allowed_per_game': 20.0},
-            'Washington Commanders': {'total_yards_per_game': 352.0, 'passing_yards_per_game': 235.0, 'rushing_yards_per_game': 117.0, 'points_allowed_per_game': 20.2},
-            'Tennessee Titans': {'total_yards_per_game': 366.8, 'passing_yards_per_game': 220.0, 'rushing_yards_per_game': 146.8, 'points_allowed_per_game': 28.2},
-            'New York Giants': {'total_yards_per_game': 377.2, 'passing_yards_per_game': 237.2, 'rushing_yards_per_game': 140.0, 'points_allowed_per_game': 25.4},
-            'Chicago Bears': {'total_yards_per_game': 379.5, 'passing_yards_per_game': 215.0, 'rushing_yards_per_game': 164.5, 'points_allowed_per_game': 29.3},
-            'Pittsburgh Steelers': {'total_yards_per_game': 382.5, 'passing_yards_per_game': 260.5, 'rushing_yards_per_game': 122.0, 'points_allowed_per_game': 24.5},
-            'Miami Dolphins': {'total_yards_per_game': 386.6, 'passing_yards_per_game': 212.4, 'rushing_yards_per_game': 174.2, 'points_allowed_per_game': 29.0},
-            'Cincinnati Bengals': {'total_yards_per_game': 391.2, 'passing_yards_per_game': 259.0, 'rushing_yards_per_game': 132.2, 'points_allowed_per_game': 31.2},
-            'Baltimore Ravens': {'total_yards_per_game': 408.8, 'passing_yards_per_game': 262.6, 'rushing_yards_per_game': 146.4, 'points_allowed_per_game': 35.4},
-            'Dallas Cowboys': {'total_yards_per_game': 412.0, 'passing_yards_per_game': 284.6, 'rushing_yards_per_game': 127.4, 'points_allowed_per_game': 30.8}
-        }
-        
-        # Normalize all team names
-        for team, stats in raw_stats.items():
-            normalized_team = normalize_team_name(team)
-            defensive_stats[normalized_team] = stats
-        
+        defensive_stats = _ESPN_DEFENSIVE_STATS
         print(f"✅ Loaded ESPN defensive stats for {len(defensive_stats)} teams")
         return defensive_stats
     
@@ -219,42 +277,16 @@ class DefensiveScraper:
             'points_allowed_per_game': 'Points Allowed'
         }
         
-        for category, display_name in categories.items():
-            # Sort teams by this category (ascending = better defense)
-            sorted_teams = sorted(
-                espn_stats.items(),
-                key=lambda x: x[1].get(category, 999)
-            )
-            
-            # Assign rankings with tie handling (average rank for tied values)
-            current_position = 1
-            i = 0
-            while i < len(sorted_teams):
-                # Find all teams tied with the current team
-                current_value = sorted_teams[i][1].get(category, 999)
-                tied_teams = []
-                j = i
-                while j < len(sorted_teams) and sorted_teams[j][1].get(category, 999) == current_value:
-                    tied_teams.append(sorted_teams[j][0])
-                    j += 1
-                
-                # Calculate average rank for tied teams
-                num_tied = len(tied_teams)
-                if num_tied == 1:
-                    avg_rank = current_position
-                else:
-                    positions = list(range(current_position, current_position + num_tied))
-                    avg_rank = round(sum(positions) / len(positions))
-                
-                # Assign the average rank to all tied teams
-                for team_name in tied_teams:
-                    if team_name not in rankings:
-                        rankings[team_name] = {}
-                    rankings[team_name][display_name] = avg_rank
-                
-                # Move to next group
-                current_position += num_tied
-                i = j
+        # OPTIMIZATION: One team x category matrix, ranked per column with argsort
+        teams = list(espn_stats)
+        if not teams:
+            return rankings
+        values = np.array([[stats.get(category, 999) for category in categories] for stats in espn_stats.values()],
+                          dtype=float)
+        
+        for column, display_name in enumerate(categories.values()):
+            for team_name, rank in zip(teams, _average_ranks(values[:, column]).tolist()):
+                rankings.setdefault(team_name, {})[display_name] = rank
         
         return rankings
     
@@ -303,40 +335,10 @@ class DefensiveScraper:
             if not teams_with_stat:
                 continue
             
-            # Sort teams by TDs allowed (ascending = better defense, fewer TDs = rank 1)
-            sorted_teams = sorted(teams_with_stat.items(), key=lambda x: x[1])
-            
-            # Assign rankings with tie handling (average rank for tied teams)
-            current_position = 1
-            i = 0
-            while i < len(sorted_teams):
-                # Find all teams tied with the current team
-                current_td_count = sorted_teams[i][1]
-                tied_teams = []
-                j = i
-                while j < len(sorted_teams) and sorted_teams[j][1] == current_td_count:
-                    tied_teams.append(sorted_teams[j][0])
-                    j += 1
-                
-                # Calculate average rank for tied teams
-                # If teams occupy positions current_position through (current_position + num_tied - 1)
-                num_tied = len(tied_teams)
-                if num_tied == 1:
-                    avg_rank = current_position
-                else:
-                    # Calculate mean of all positions they occupy
-                    positions = list(range(current_position, current_position + num_tied))
-                    avg_rank = round(sum(positions) / len(positions))
-                
-                # Assign the average rank to all tied teams
-                for team_name in tied_teams:
-                    if team_name not in rankings:
-                        rankings[team_name] = {}
-                    rankings[team_name][stat_name] = avg_rank
-                
-                # Move to next group
-                current_position += num_tied
-                i = j
+            # Fewer TDs allowed = better defense (rank 1); ties share the average rank
+            ranks = _average_ranks(np.array(list(teams_with_stat.values()), dtype=float))
+            for team_name, rank in zip(teams_with_stat, ranks.tolist()):
+                rankings.setdefault(team_name, {})[stat_name] = rank
         
         return rankings
     
@@ -359,19 +361,24 @@ class DefensiveScraper:
             if raw_td_stats:
                 # Save the raw TD counts from NFL.com scraping
                 with open(td_cache_file, 'wb') as f:
-                    pickle.dump(raw_td_stats, f)
+                    pickle.dump(raw_td_stats, f, protocol=pickle.HIGHEST_PROTOCOL)
                 print(f"💾 Saved raw TD counts to {td_cache_file}")
             else:
                 # Fallback: extract TD data from combined data (may be rankings)
                 td_stats = {team: {k: v for k, v in stats.items() if 'TDs Allowed' in k} 
                            for team, stats in data.items()}
                 with open(td_cache_file, 'wb') as f:
-                    pickle.dump(td_stats, f)
+                    pickle.dump(td_stats, f, protocol=pickle.HIGHEST_PROTOCOL)
                 print(f"💾 Saved TD stats to {td_cache_file}")
             
             # Save full rankings (JSON format)
-            with open(rankings_cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                # Same 2-space layout as json.dump(indent=2)
+                with open(rankings_cache_file, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(rankings_cache_file, 'w') as f:
+                    json.dump(data, f, indent=2)
             print(f"💾 Saved defensive rankings to {rankings_cache_file}")
             
         except Exception as e:
@@ -383,8 +390,12 @@ class DefensiveScraper:
         try:
             # Try to load from JSON first (has complete data)
             if os.path.exists(rankings_cache_file):
-                with open(rankings_cache_file, 'r') as f:
-                    data = json.load(f)
+                if ORJSON_AVAILABLE:
+                    with open(rankings_cache_file, 'rb') as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(rankings_cache_file, 'r') as f:
+                        data = json.load(f)
                 print(f"📁 Loaded defensive data from cache")
                 return data
         except Exception as e:
@@ -7,15 +7,187 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 import os
+import sys
 import json
-from datetime import datetime, timedelta
+import csv
+import time
+import hashlib
+from datetime import date, datetime, timedelta
 import pickle
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import csv as pacsv
 # from dfs_box_scores import FootballDBScraper  # Not needed for production
 from defensive_scraper import DefensiveScraper
 from position_defensive_ranks import PositionDefensiveRankings
 import warnings
+from functools import lru_cache
+from utils import clean_player_name, get_team_abbreviation
 warnings.filterwarnings('ignore')
 
+# Numba is optional - without it the batch over-rate path uses NumPy only
+try:
+    from numba import njit as _njit, prange as _prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    _prange = range
+    NUMBA_AVAILABLE = False
+
+# Columns of 2025/WEEK*/box_score_debug.csv (written by dfs_box_scores.py) and their types.
+# Stat columns are written as integers with missing values filled as 0.
+BOX_SCORE_STAT_COLUMNS = [
+    'pass_Yds', 'pass_TD', 'pass_INT', 'pass_Att', 'pass_Cmp',
+    'rush_Yds', 'rush_TD', 'rush_Att',
+    'rec_Rec', 'rec_Yds', 'rec_TD', 'rec_Tar'
+]
+BOX_SCORE_USECOLS = ['Name', 'team'] + BOX_SCORE_STAT_COLUMNS
+BOX_SCORE_ARROW_TYPES = {'Name': pa.string(), 'team': pa.string(),
+                         **{col: pa.int64() for col in BOX_SCORE_STAT_COLUMNS}}
+
+# Stat types tracked per player in player_season_stats
+PLAYER_STAT_TYPES = ['Passing Yards', 'Passing TDs', 'Rushing Yards', 'Rushing TDs',
+                     'Receptions', 'Receiving Yards', 'Receiving TDs']
+
+# Prop stat type -> team defensive stat it is ranked against.
+# Note: ESPN doesn't have separate receiving stats, so we use passing stats as proxy
+DEFENSIVE_STAT_MAPPING = {
+    'Passing Yards': 'Passing Yards Allowed',
+    'Passing TDs': 'Passing TDs Allowed',
+    'Rushing Yards': 'Rushing Yards Allowed',
+    'Rushing TDs': 'Rushing TDs Allowed',
+    'Receptions': 'Passing Yards Allowed',      # Use passing defense as proxy
+    'Receiving Yards': 'Passing Yards Allowed',  # Use passing defense as proxy
+    'Receiving TDs': 'Passing TDs Allowed'       # Use passing TDs as proxy
+}
+
+# Season caches stored as Parquet tables, loaded at startup; other cache types are pickled.
+# cache type -> processor attribute, table encode/decode methods and display name
+_SEASON_CACHES = {
+    'team_defensive': {'attribute': 'team_defensive_stats', 'to_table': '_nested_dict_to_table',
+                       'from_table': '_nested_dict_from_table', 'label': 'team defensive'},
+    'player_season': {'attribute': 'player_season_stats', 'to_table': '_player_stats_to_table',
+                      'from_table': '_player_stats_from_table', 'label': 'player season'}
+}
+_PARQUET_CACHE_TYPES = tuple(_SEASON_CACHES)
+
+# Parquet schema metadata key holding the signature of the files a cache was built from
+_CACHE_SIGNATURE_KEY = b'source_signature'
+
+# Parquet copies of the 2025/WEEK*/box_score_debug.csv files live with the other caches
+# in this subdirectory of the data directory, one file per week
+# (e.g. data/box_score_parquet/2025_WEEK3.parquet)
+BOX_SCORE_PARQUET_DIR = "box_score_parquet"
+
+# Pickled caches are written with the newest protocol through a 1 MiB buffer
+_PICKLE_BUFFER_SIZE = 1 << 20
+
+# Box score columns summed into each opponent's yards/TDs allowed for historical rankings
+_HISTORICAL_ALLOWED_COLUMNS = {
+    'pass_Yds': 'Passing Yards Allowed',
+    'pass_TD': 'Passing TDs Allowed',
+    'rush_Yds': 'Rushing Yards Allowed',
+    'rush_TD': 'Rushing TDs Allowed',
+}
+
+# How long a discovered list of week box score files is reused before rescanning 2025/
+_WEEK_DISCOVERY_TTL_SECONDS = 30
+
+# How long combined defensive data from DefensiveScraper is reused in-process, and how
+# long a failed fetch is remembered so the fallback rankings are used without retrying
+_DEFENSIVE_DATA_TTL_SECONDS = 3600
+_DEFENSIVE_DATA_NEGATIVE_TTL_SECONDS = 60
+_defensive_data_memo = {'data': None, 'fetched_at': 0.0, 'failed_until': 0.0}
+
+# Fallback yards-allowed per game used when real defensive data is unavailable.
+# Receiving defense mirrors passing defense, so the same dict is shared for both.
+# These are shared across instances - treat them as read-only.
+_FALLBACK_PASS_YARDS_ALLOWED = {
+    'San Francisco 49ers': 195, 'Buffalo Bills': 205, 'New York Jets': 210,
+    'Pittsburgh Steelers': 215, 'New England Patriots': 220, 'Baltimore Ravens': 220,
+    'Cleveland Browns': 225, 'New Orleans Saints': 225, 'Cincinnati Bengals': 235,
+    'Kansas City Chiefs': 235, 'Minnesota Vikings': 235, 'Tampa Bay Buccaneers': 235,
+    'Philadelphia Eagles': 230, 'Los Angeles Rams': 230, 'Green Bay Packers': 230,
+    'Indianapolis Colts': 240, 'Miami Dolphins': 240, 'Tennessee Titans': 240,
+    'Atlanta Falcons': 240, 'Carolina Panthers': 230, 'Chicago Bears': 245,
+    'Detroit Lions': 245, 'Jacksonville Jaguars': 245, 'Los Angeles Chargers': 245,
+    'Seattle Seahawks': 245, 'Arizona Cardinals': 250, 'Dallas Cowboys': 250,
+    'Houston Texans': 250, 'Las Vegas Raiders': 250, 'Denver Broncos': 255,
+    'New York Giants': 250, 'Washington Commanders': 250
+}
+
+_FALLBACK_RUSH_YARDS_ALLOWED = {
+    'San Francisco 49ers': 85, 'Buffalo Bills': 90, 'New York Jets': 95,
+    'Pittsburgh Steelers': 95, 'New England Patriots': 100, 'Baltimore Ravens': 100,
+    'Cleveland Browns': 100, 'New Orleans Saints': 105, 'Cincinnati Bengals': 105,
+    'Kansas City Chiefs': 110, 'Minnesota Vikings': 110, 'Tampa Bay Buccaneers': 110,
+    'Philadelphia Eagles': 110, 'Los Angeles Rams': 110, 'Green Bay Packers': 115,
+    'Indianapolis Colts': 115, 'Miami Dolphins': 115, 'Tennessee Titans': 115,
+    'Atlanta Falcons': 115, 'Carolina Panthers': 110, 'Chicago Bears': 120,
+    'Detroit Lions': 120, 'Jacksonville Jaguars': 120, 'Los Angeles Chargers': 120,
+    'Seattle Seahawks': 120, 'Arizona Cardinals': 125, 'Dallas Cowboys': 125,
+    'Houston Texans': 125, 'Las Vegas Raiders': 125, 'Denver Broncos': 130,
+    'New York Giants': 130, 'Washington Commanders': 130
+}
+
+def _over_rates_kernel(values, weeks, offsets, segments, lines, max_week):
+    """
+    Over rate of each requested segment of a stat's SoA arrays, in one fused pass
+    
+    Counts only games before max_week (max_week < 0 disables the filter); a segment
+    with no games before max_week keeps all its games. Compiled with Numba when available.
+    """
+    rates = np.empty(segments.size, dtype=np.float64)
+    for i in _prange(segments.size):
+        start = offsets[segments[i]]
+        end = offsets[segments[i] + 1]
+        over = 0
+        before = 0
+        over_before = 0
+        for j in range(start, end):
+            is_over = values[j] > lines[i]
+            over += is_over
+            if max_week >= 0 and weeks[j] < max_week:
+                before += 1
+                over_before += is_over
+        if before > 0:
+            rates[i] = over_before / before
+        else:
+            rates[i] = over / (end - start)
+    return rates
+
+
+def _streak_kernel(values, weeks, line):
+    """
+    Consecutive games over the line, walking back from the most recent game
+    
+    The streak stops at the first game that didn't go over, or at a gap of 3+ weeks
+    between consecutive games. Compiled with Numba when available.
+    """
+    streak = 0
+    for k in range(values.size - 1, -1, -1):
+        if not values[k] > line:
+            break
+        if streak > 0 and weeks[k + 1] - weeks[k] >= 3:
+            break
+        streak += 1
+    return streak
+
+
+def _warm_up_kernels():
+    """Compile the Numba kernels for the dtypes they are called with, ahead of the first request"""
+    values = np.zeros(1, dtype=np.float32)
+    weeks = np.zeros(1, dtype=np.int16)
+    offsets = np.array([0, 1], dtype=np.int64)
+    _over_rates_kernel(values, weeks, offsets, np.zeros(1, dtype=np.int64), np.zeros(1), -1)
+    _streak_kernel(values.astype(np.float64), weeks, 0.0)
+
+
+if NUMBA_AVAILABLE:
+    # No fastmath: it lets NaN compare as over the line
+    _over_rates_kernel = _njit(parallel=True, cache=True)(_over_rates_kernel)
+    _streak_kernel = _njit(cache=True)(_streak_kernel)
+
+
 class EnhancedFootballDataProcessor:
     """Enhanced data processor that uses real FootballDB data with database support"""
     
@@ -36,11 +208,12 @@ class EnhancedFootballDataProcessor:
         self.current_week = self._get_current_week()
         self.max_week = max_week  # Used for filtering historical data (None = use all weeks)
         self.skip_calculations = skip_calculations
+        self._reset_lookup_caches()
         
         # Initialize database loader
         try:
             from database.database_enhanced_data_processor import DatabaseBoxScoreLoader
-            self.db_loader = DatabaseBoxScoreLoader()
+            self.db_loader = DatabaseBoxScoreLoader(data_dir)
             print("🗄️ Using database for box score data loading")
         except Exception as e:
             print(f"⚠️ Could not initialize database loader: {e}")
@@ -70,9 +243,14 @@ class EnhancedFootballDataProcessor:
         
     def _get_current_week(self) -> int:
         """Get current NFL week"""
-        current_date = datetime.now()
+        return self._current_week_for_date(datetime.now().date())
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _current_week_for_date(current_date: date) -> int:
+        """NFL week for a date, memoized so processors created on the same day share it"""
         # NFL season typically starts first week of September
-        season_start = datetime(current_date.year, 9, 1)
+        season_start = date(current_date.year, 9, 1)
         weeks_elapsed = (current_date - season_start).days // 7
         return min(max(1, weeks_elapsed), 18)  # NFL regular season is 18 weeks max
     
@@ -81,7 +259,7 @@ class EnhancedFootballDataProcessor:
         try:
             schedule_path = "2025/nfl_schedule.csv"
             if os.path.exists(schedule_path):
-                df = pd.read_csv(schedule_path)
+                df = pd.read_csv(schedule_path, engine='pyarrow')  # Multi-threaded Arrow parser
                 print(f"✅ Loaded NFL schedule with {len(df)} games")
                 return df
             else:
@@ -112,6 +290,8 @@ class EnhancedFootballDataProcessor:
                     home_team = game.home_team
                     away_team = game.away_team
                     commence_time = game.commence_time
+                    # Format the MM/DD display date once here rather than on every lookup
+                    game_date = self._format_game_date(commence_time)
                     
                     if not week_num in opponent_map:
                         opponent_map[week_num] = {}
@@ -120,12 +300,14 @@ class EnhancedFootballDataProcessor:
                     opponent_map[week_num][home_team] = {
                         'opponent': away_team,
                         'is_home': True,
-                        'game_time': commence_time
+                        'game_time': commence_time,
+                        'game_date': game_date
                     }
                     opponent_map[week_num][away_team] = {
                         'opponent': home_team,
                         'is_home': False,
-                        'game_time': commence_time
+                        'game_time': commence_time,
+                        'game_date': game_date
                     }
                 
                 print(f"✅ Built opponent mapping for {len(opponent_map)} weeks from database")
@@ -147,107 +329,370 @@ class EnhancedFootballDataProcessor:
         Returns:
             True for home, False for away, None if unknown/bye week
         """
-        # Use opponent mapping from game data
-        if week in self.opponent_mapping and team in self.opponent_mapping[week]:
-            return self.opponent_mapping[week][team]['is_home']
+        # None if team not found in schedule for this week (bye week or not found)
+        return self._get_venue_map().get((team, week))
+    
+    def _get_venue_map(self) -> Dict[Tuple[str, int], bool]:
+        """
+        OPTIMIZATION: Flatten the opponent mapping into a (team, week) -> is_home dict
+        
+        Rebuilt whenever opponent_mapping is reassigned.
+        """
+        if self._venue_map is None or self._venue_map_source is not self.opponent_mapping:
+            self._venue_map = {(team, week): opponent_info['is_home']
+                               for week, teams in self.opponent_mapping.items()
+                               for team, opponent_info in teams.items()}
+            self._venue_map_source = self.opponent_mapping
+        return self._venue_map
+    
+    def _venue_series(self, teams: pd.Series, weeks: pd.Series) -> pd.Series:
+        """
+        Vectorized is_home_game for aligned team/week columns
         
-        return None  # Team not found in schedule for this week (bye week or not found)
+        Returns:
+            Object Series (same index as teams) of True for home, False for away, None if unknown
+        """
+        venue_map = self._get_venue_map()
+        is_home = [venue_map.get(key) for key in zip(teams.tolist(), weeks.tolist())]
+        return pd.Series(is_home, index=teams.index, dtype=object)
     
     def _get_cache_file(self, data_type: str) -> str:
         """Get cache file path for a data type"""
-        return os.path.join(self.data_dir, f"{data_type}_cache.pkl")
+        extension = 'parquet' if data_type in _PARQUET_CACHE_TYPES else 'pkl'
+        return os.path.join(self.data_dir, f"{data_type}_cache.{extension}")
     
     def _is_cache_valid(self, cache_file: str, max_age_hours: int = 24) -> bool:
         """
         Check if cache file is still valid
         
-        Validates cache by checking:
-        1. File exists
-        2. Age is within max_age_hours
-        3. Source CSV files haven't been updated since cache was created
-        
-        This prevents stale cache issues when new week data is added on Tuesdays.
+        Player season and team defensive caches are valid while the data they were built
+        from is unchanged (see _compute_source_signature): the weeks in the database and
+        any box score / schedule CSVs. New weeks invalidate them immediately. When there is
+        no source to fingerprint, they fall back to the max_age_hours check like other caches.
         """
-        if not os.path.exists(cache_file):
+        # One stat call covers both the existence check and the age check below
+        try:
+            cache_mtime = os.stat(cache_file).st_mtime
+        except OSError:
             return False
         
-        # Check if cache is older than max_age_hours
-        cache_time = datetime.fromtimestamp(os.path.getmtime(cache_file))
-        age_hours = (datetime.now() - cache_time).total_seconds() / 3600
+        cache_type = os.path.basename(cache_file).rsplit('_cache.', 1)[0]
+        if cache_type in _PARQUET_CACHE_TYPES:
+            signature = self._compute_source_signature()
+            if signature is not None:
+                try:
+                    metadata = pq.read_schema(cache_file).metadata or {}
+                except Exception:
+                    return False
+                if metadata.get(_CACHE_SIGNATURE_KEY) != signature:
+                    print(f"⚠️ {cache_type} cache invalid: source weeks or files changed since it was built")
+                    return False
+                return True
+        
+        age_hours = (time.time() - cache_mtime) / 3600
+        return age_hours < max_age_hours
+    
+    def _compute_source_signature(self) -> Optional[bytes]:
+        """
+        Fingerprint the data the season caches are built from
         
-        if age_hours >= max_age_hours:
-            return False
+        Hashes the weeks available in the database, plus path, mtime and size of every
+        2025/WEEK*/box_score_debug.csv and the schedule CSV, so a new week or a
+        rewritten file changes the signature.
+        
+        Returns:
+            Signature bytes, or None if there was no source to fingerprint
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        has_source = False
+        
+        db_loader = getattr(self, 'db_loader', None)
+        if db_loader:
+            db_weeks = db_loader.get_available_weeks()
+            if db_weeks:
+                digest.update(f"db_weeks|{','.join(map(str, db_weeks))}\n".encode())
+                has_source = True
+        
+        paths = [f"2025/WEEK{week}/box_score_debug.csv" for week in self._discover_box_score_weeks()]
+        paths.append("2025/nfl_schedule.csv")
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            digest.update(f"{path}|{stat.st_mtime_ns}|{stat.st_size}\n".encode())
+            has_source = True
+        return digest.hexdigest().encode() if has_source else None
+    
+    def _discover_box_score_weeks(self) -> List[int]:
+        """
+        Find weeks 1-18 that have a box score CSV, with a single listing of 2025/
+        
+        The result is reused for a short time so repeated callers don't rescan the filesystem.
+        """
+        if (self._box_score_weeks is not None
+                and time.time() - self._box_score_weeks_time < _WEEK_DISCOVERY_TTL_SECONDS):
+            return self._box_score_weeks
         
-        # For player_season and team_defensive cache, check if any CSV files are newer
-        # This is critical for detecting when new weeks are added (typically Tuesdays)
-        if 'player_season' in cache_file or 'team_defensive' in cache_file:
-            base_path = "2025"
-            if os.path.exists(base_path):
-                for week in range(1, 19):  # Check weeks 1-18
-                    csv_file = f"{base_path}/WEEK{week}/box_score_debug.csv"
-                    if os.path.exists(csv_file):
-                        csv_time = datetime.fromtimestamp(os.path.getmtime(csv_file))
-                        if csv_time > cache_time:
-                            cache_type = "player_season" if "player_season" in cache_file else "team_defensive"
-                            print(f"⚠️ {cache_type} cache invalid: WEEK{week} CSV is newer than cache")
-                            return False
-        
-        return True
+        weeks = []
+        try:
+            with os.scandir("2025") as entries:
+                for entry in entries:
+                    if not entry.name.startswith("WEEK") or not entry.name[4:].isdigit():
+                        continue
+                    week = int(entry.name[4:])
+                    if 1 <= week <= 18 and os.path.isfile(os.path.join(entry.path, "box_score_debug.csv")):
+                        weeks.append(week)
+        except OSError:
+            # No 2025/ directory - no box score files
+            pass
+        
+        self._box_score_weeks = sorted(weeks)
+        self._box_score_weeks_time = time.time()
+        return self._box_score_weeks
+    
+    def _reset_lookup_caches(self):
+        """Reset in-memory caches of week and player data loaded from the database"""
+        self._player_games_cache = {}  # (cleaned_name, stat_type) -> DataFrame
+        self._week_data_cache = {}  # week -> processed week data from scrape_week_data
+        self._game_context_df = None  # (team, week) -> opponent, home/away and date
+        self._matchup_index = None  # (team1, team2) -> matchup details, built from schedule_data
+        self._matchup_index_source = None  # schedule_data the matchup index was built from
+        self._schedule_opponents = None  # week -> team -> opponent, built from schedule_data
+        self._schedule_opponents_source = None  # schedule_data the opponent index was built from
+        self._def_rank_cache = {}  # (team, stat_type) -> defensive rank
+        self._def_rank_cache_source = None  # Rankings the defensive rank cache was filled from
+        self._def_rank_records = {}  # (team, defensive stat) -> rank for the active rankings
+        self._def_rank_records_lower = {}  # (lowercased team, defensive stat) -> rank
+        self._stat_soa = {}  # stat_type -> all players' game logs for that stat, concatenated
+        self._stat_soa_source = None  # player_season_stats the SoA arrays were built from
+        self._stat_moments = {}  # (player, stat_type) -> (games, mean, std) of the season log
+        self._stat_moments_source = None  # player_season_stats the moments were computed from
+        self._sorted_games = {}  # (player, stat_type) -> sorted season log (filtered by max_week)
+        self._sorted_games_source = None  # (player_season_stats, max_week) the sorted logs came from
+        self._player_lower_index = {}  # Lowercased cleaned name -> player key
+        self._player_lower_index_source = None  # player_season_stats the lowercase index was built from
+        self._venue_map = None  # (team, week) -> is_home, built from opponent_mapping
+        self._venue_map_source = None  # opponent_mapping the venue map was built from
+        self._box_score_weeks = None  # Weeks with a box score CSV on disk
+        self._box_score_weeks_time = 0.0  # When _box_score_weeks was last scanned
+    
+    def get_player_key_case_insensitive(self, player: str) -> Optional[str]:
+        """
+        Find a player's key in player_season_stats by cleaned name, ignoring case
+        
+        Args:
+            player: Player name (cleaned before lookup)
+            
+        Returns:
+            The stored player key, or None if no player matches
+        """
+        # OPTIMIZATION: Lowercased cleaned name -> player key, rebuilt when the stats are replaced
+        if self._player_lower_index_source is not self.player_season_stats:
+            self._player_lower_index = {}
+            for player_key in self.player_season_stats:
+                # The first stored player with a matching name wins
+                self._player_lower_index.setdefault(clean_player_name(player_key).lower(), player_key)
+            self._player_lower_index_source = self.player_season_stats
+        
+        return self._player_lower_index.get(clean_player_name(player).lower())
     
     def _rebuild_player_name_index(self):
         """Rebuild the player name index for fast lookups"""
-        from utils import clean_player_name
-        self.player_name_index = {}
-        for player_key in self.player_season_stats.keys():
-            cleaned = clean_player_name(player_key)
-            self.player_name_index[cleaned] = player_key
+        self.player_name_index = {clean_player_name(player_key): player_key
+                                  for player_key in self.player_season_stats}
     
     def _load_cached_data(self):
         """Load cached data if available and valid"""
-        # Load team defensive stats
-        team_cache_file = self._get_cache_file("team_defensive")
-        if self._is_cache_valid(team_cache_file, max_age_hours=168):  # 1 week
-            try:
-                with open(team_cache_file, 'rb') as f:
-                    self.team_defensive_stats = pickle.load(f)
-                print(f"✅ Loaded cached team defensive stats")
-            except Exception as e:
-                print(f"⚠️ Could not load team defensive cache: {e}")
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # The season caches are independent file reads, so read them in parallel
+        with ThreadPoolExecutor(max_workers=len(_SEASON_CACHES)) as executor:
+            loaded = dict(zip(_SEASON_CACHES, executor.map(self._read_season_cache, _SEASON_CACHES)))
+        
+        for cache_type, (data, error) in loaded.items():
+            label = _SEASON_CACHES[cache_type]['label']
+            if error is not None:
+                print(f"⚠️ Could not load {label} cache: {error}")
+            elif data is not None and (cache_type != 'player_season' or self._validate_player_season_cache(data)):
+                setattr(self, _SEASON_CACHES[cache_type]['attribute'], data)
+                print(f"✅ Loaded cached {label} stats")
+        
+        # Index the final player dict once, whichever caches loaded
+        if self.player_season_stats:
+            self._rebuild_player_name_index()
+    
+    def _read_season_cache(self, cache_type: str) -> Tuple[Optional[Dict], Optional[Exception]]:
+        """
+        Read one season cache (see _SEASON_CACHES)
         
-        # Load player season stats
+        Returns:
+            (data, error) - data is None if the cache is missing, stale or unreadable
+        """
+        cache_file = self._get_cache_file(cache_type)
+        if not self._is_cache_valid(cache_file):
+            return None, None
+        try:
+            from_table = getattr(self, _SEASON_CACHES[cache_type]['from_table'])
+            return from_table(pq.read_table(cache_file)), None
+        except Exception as e:
+            return None, e
+    
+    def _validate_player_season_cache(self, player_season_stats: Dict) -> bool:
+        """Check a loaded player season cache is in the current format, deleting it if not"""
         player_cache_file = self._get_cache_file("player_season")
-        if self._is_cache_valid(player_cache_file, max_age_hours=168):  # 1 week
-            try:
-                with open(player_cache_file, 'rb') as f:
-                    self.player_season_stats = pickle.load(f)
-                
-                # Validate cache has week data (needed for historical filtering)
-                cache_has_weeks = False
-                if self.player_season_stats:
-                    # Check first player's data for week information
-                    first_player = next(iter(self.player_season_stats.values()))
-                    cache_has_weeks = any(key.endswith('_weeks') for key in first_player.keys())
-                
-                if not cache_has_weeks:
-                    print(f"⚠️ Cache is outdated (missing week tracking). Clearing cache...")
-                    self.player_season_stats = {}
-                    os.remove(player_cache_file)
-                else:
-                    self._rebuild_player_name_index()
-                    print(f"✅ Loaded cached player season stats")
-            except Exception as e:
-                print(f"⚠️ Could not load player season cache: {e}")
+        
+        # Validate cache has week data (needed for historical filtering)
+        cache_has_weeks = False
+        cache_has_arrays = False
+        if player_season_stats:
+            # Check first player's data for week information
+            first_player = next(iter(player_season_stats.values()))
+            cache_has_weeks = any(key.endswith('_weeks') for key in first_player.keys())
+            # Game logs are stored as NumPy arrays; older caches hold lists
+            cache_has_arrays = all(isinstance(values, np.ndarray)
+                                   for key, values in first_player.items() if key != 'team')
+        
+        if not cache_has_weeks:
+            print(f"⚠️ Cache is outdated (missing week tracking). Clearing cache...")
+        elif not cache_has_arrays:
+            print(f"⚠️ Cache is outdated (list-based game logs). Clearing cache...")
+        else:
+            return True
+        
+        self.player_season_stats = {}
+        try:
+            os.remove(player_cache_file)
+        except OSError as e:
+            print(f"⚠️ Could not remove outdated player season cache: {e}")
+        return False
     
     def _save_cache(self, data: dict, data_type: str):
         """Save data to cache"""
         cache_file = self._get_cache_file(data_type)
         try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(data, f)
+            if data_type in _SEASON_CACHES:
+                table = getattr(self, _SEASON_CACHES[data_type]['to_table'])(data)
+                # Record the source signature so _is_cache_valid can tell if it is stale
+                table = table.replace_schema_metadata({_CACHE_SIGNATURE_KEY: self._compute_source_signature() or b''})
+                pq.write_table(table, cache_file, compression='zstd')
+            else:
+                with open(cache_file, 'wb', buffering=_PICKLE_BUFFER_SIZE) as f:
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
             print(f"💾 Cached {data_type} data")
         except Exception as e:
             print(f"⚠️ Could not save cache for {data_type}: {e}")
     
+    @staticmethod
+    def _player_stats_to_table(player_stats: Dict) -> pa.Table:
+        """
+        Flatten player season stats into a long table with one row per game
+        
+        Columns are player, team, stat, venue ('all', 'home' or 'away'), week and value.
+        Players with no games get a single row with a null stat so their team is kept.
+        """
+        group_players, group_teams, group_stats, group_venues, group_sizes = [], [], [], [], []
+        value_chunks, week_chunks = [], []
+        
+        for player, data in player_stats.items():
+            team = data.get('team')
+            has_games = False
+            
+            for key, values in data.items():
+                if key == 'team' or key.endswith('_weeks'):
+                    continue
+                
+                if key.endswith('_home'):
+                    stat, venue = key[:-len('_home')], 'home'
+                elif key.endswith('_away'):
+                    stat, venue = key[:-len('_away')], 'away'
+                else:
+                    stat, venue = key, 'all'
+                
+                values = np.asarray(values, dtype=np.float32)
+                weeks = np.asarray(data.get(f"{key}_weeks", []), dtype=np.int16)
+                if weeks.size != values.size:
+                    weeks = np.full(values.size, -1, dtype=np.int16)  # Week unknown
+                
+                group_players.append(player)
+                group_teams.append(team)
+                group_stats.append(stat)
+                group_venues.append(venue)
+                group_sizes.append(values.size)
+                value_chunks.append(values)
+                week_chunks.append(weeks)
+                has_games = True
+            
+            if not has_games:
+                group_players.append(player)
+                group_teams.append(team)
+                group_stats.append(None)
+                group_venues.append(None)
+                group_sizes.append(1)
+                value_chunks.append(np.full(1, np.nan, dtype=np.float32))
+                week_chunks.append(np.full(1, -1, dtype=np.int16))
+        
+        def repeat_column(group_values):
+            # Per-group labels repeated for each game, dictionary-encoded on disk
+            return pa.array(np.repeat(np.array(group_values, dtype=object), group_sizes),
+                            type=pa.string()).dictionary_encode()
+        
+        empty_float = np.empty(0, dtype=np.float32)
+        empty_int = np.empty(0, dtype=np.int16)
+        return pa.table({
+            'player': repeat_column(group_players),
+            'team': repeat_column(group_teams),
+            'stat': repeat_column(group_stats),
+            'venue': repeat_column(group_venues),
+            'week': pa.array(np.concatenate(week_chunks) if week_chunks else empty_int),
+            'value': pa.array(np.concatenate(value_chunks) if value_chunks else empty_float)
+        })
+    
+    @staticmethod
+    def _player_stats_from_table(table: pa.Table) -> Dict:
+        """Rebuild player season stats from a table written by _player_stats_to_table"""
+        df = table.to_pandas()
+        player_stats = {}
+        
+        # Team (and dict order) per player, in the order players were written.
+        # Names are interned so every player on a team shares one string.
+        for player, team in df.drop_duplicates('player')[['player', 'team']].itertuples(index=False):
+            player_stats[sys.intern(player)] = {'team': sys.intern(team)} if pd.notna(team) else {}
+        
+        games = df.dropna(subset=['stat'])
+        values = games['value'].to_numpy(dtype=np.float32)
+        weeks = games['week'].to_numpy(dtype=np.int16)
+        
+        groups = games.groupby(['player', 'stat', 'venue'], sort=False, observed=True).indices
+        for (player, stat, venue), rows in groups.items():
+            key = sys.intern(stat if venue == 'all' else f"{stat}_{venue}")
+            player_stats[player][key] = values[rows]
+            player_stats[player][sys.intern(f"{key}_weeks")] = weeks[rows]
+        
+        return player_stats
+    
+    @staticmethod
+    def _nested_dict_to_table(data: Dict) -> pa.Table:
+        """Flatten a {key: {stat: number}} dict (e.g. team defensive ranks) into a table"""
+        rows = [(key, stat, value) for key, stats in data.items() for stat, value in stats.items()]
+        return pa.table({
+            'key': pa.array([row[0] for row in rows], type=pa.string()),
+            'stat': pa.array([row[1] for row in rows], type=pa.string()),
+            'value': pa.array([row[2] for row in rows], type=pa.float64())
+        })
+    
+    @staticmethod
+    def _nested_dict_from_table(table: pa.Table) -> Dict:
+        """Rebuild a nested dict from a table written by _nested_dict_to_table"""
+        data = {}
+        columns = table.to_pydict()
+        for key, stat, value in zip(columns['key'], columns['stat'], columns['value']):
+            # Whole-number ranks come back as ints so they display as "12", not "12.0"
+            if value is not None and float(value).is_integer():
+                value = int(value)
+            data.setdefault(sys.intern(key), {})[sys.intern(stat)] = value
+        return data
+    
     def clear_all_caches(self):
         """
         Clear all cache files to force fresh data load
@@ -281,6 +726,7 @@ class EnhancedFootballDataProcessor:
         self.team_defensive_stats = {}
         self.historical_defensive_stats = {}
         self.player_name_index = {}
+        self._reset_lookup_caches()
         
         print("✅ All caches cleared. Data will be rebuilt on next access.")
     
@@ -293,14 +739,19 @@ class EnhancedFootballDataProcessor:
         import glob
         
         status = {}
+        # One clock reading for the whole report, so all ages are measured from the same moment
+        now = datetime.now()
         
         # Check main caches
         cache_types = ['player_season', 'team_defensive', 'nfl_defensive_td']
         for cache_type in cache_types:
             cache_file = self._get_cache_file(cache_type)
-            if os.path.exists(cache_file):
+            try:
                 cache_time = datetime.fromtimestamp(os.path.getmtime(cache_file))
-                age_hours = (datetime.now() - cache_time).total_seconds() / 3600
+            except OSError:
+                cache_time = None
+            if cache_time is not None:
+                age_hours = (now - cache_time).total_seconds() / 3600
                 is_valid = self._is_cache_valid(cache_file, max_age_hours=168)
                 
                 status[cache_type] = {
@@ -320,7 +771,7 @@ class EnhancedFootballDataProcessor:
             for cache_file in ranking_caches:
                 week = cache_file.split('week')[1].replace('.pkl', '')
                 cache_time = datetime.fromtimestamp(os.path.getmtime(cache_file))
-                age_hours = (datetime.now() - cache_time).total_seconds() / 3600
+                age_hours = (now - cache_time).total_seconds() / 3600
                 
                 status['defensive_rankings'][f'week_{week}'] = {
                     'age_hours': round(age_hours, 1),
@@ -339,7 +790,7 @@ class EnhancedFootballDataProcessor:
         
         if os.path.exists(cache_file):
             try:
-                with open(cache_file, 'rb') as f:
+                with open(cache_file, 'rb', buffering=_PICKLE_BUFFER_SIZE) as f:
                     self.historical_defensive_stats = pickle.load(f)
                 print(f"✅ Loaded historical defensive rankings for Week {self.max_week} from cache")
                 return
@@ -352,8 +803,8 @@ class EnhancedFootballDataProcessor:
         
         # Save to cache
         try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(self.historical_defensive_stats, f)
+            with open(cache_file, 'wb', buffering=_PICKLE_BUFFER_SIZE) as f:
+                pickle.dump(self.historical_defensive_stats, f, protocol=pickle.HIGHEST_PROTOCOL)
             print(f"💾 Cached historical defensive rankings for Week {self.max_week}")
         except Exception as e:
             print(f"⚠️ Could not save historical defensive cache: {e}")
@@ -380,24 +831,23 @@ class EnhancedFootballDataProcessor:
                 continue
             
             try:
-                df = pd.read_csv(box_score_path)
+                df = self._read_box_score_csv(
+                    box_score_path, columns=['team', 'pass_Yds', 'pass_TD', 'rush_Yds', 'rush_TD'],
+                    data_dir=self.data_dir)
                 
                 # Get opponent mapping for this week from schedule
                 opponent_map = self._get_opponent_map_for_week(week)
                 
-                # For each player's stats, attribute them to the opposing defense
-                for _, row in df.iterrows():
-                    player_team = row.get('team', '')
-                    
-                    if not player_team or pd.isna(player_team):
-                        continue
-                    
-                    # Get opponent from mapping
-                    opponent = opponent_map.get(player_team)
-                    
-                    if not opponent or opponent == 'BYE':
-                        continue
-                    
+                # For each player's stats, attribute them to the opposing defense.
+                # OPTIMIZATION: Map teams to opponents column-wise and sum per opponent
+                # instead of walking rows; NaN stats are skipped by the sum.
+                stat_columns = [col for col in _HISTORICAL_ALLOWED_COLUMNS if col in df.columns]
+                opponents = (df['team'].map(opponent_map) if 'team' in df.columns
+                             else pd.Series(None, index=df.index, dtype=object))
+                has_opponent = opponents.notna() & (opponents != 'BYE')
+                allowed = df.loc[has_opponent, stat_columns].groupby(opponents[has_opponent], sort=False).sum()
+                
+                for opponent, totals in zip(allowed.index, allowed.itertuples(index=False)):
                     # Initialize opponent in defensive stats if not exists
                     if opponent not in defensive_stats:
                         defensive_stats[opponent] = {
@@ -409,17 +859,9 @@ class EnhancedFootballDataProcessor:
                         }
                     
                     # Aggregate offensive stats as defensive stats allowed
-                    # Passing
-                    if pd.notna(row.get('pass_Yds')):
-                        defensive_stats[opponent]['Passing Yards Allowed'] += float(row['pass_Yds'])
-                    if pd.notna(row.get('pass_TD')):
-                        defensive_stats[opponent]['Passing TDs Allowed'] += float(row['pass_TD'])
-                    
-                    # Rushing
-                    if pd.notna(row.get('rush_Yds')):
-                        defensive_stats[opponent]['Rushing Yards Allowed'] += float(row['rush_Yds'])
-                    if pd.notna(row.get('rush_TD')):
-                        defensive_stats[opponent]['Rushing TDs Allowed'] += float(row['rush_TD'])
+                    opponent_stats = defensive_stats[opponent]
+                    for col, total in zip(stat_columns, totals):
+                        opponent_stats[_HISTORICAL_ALLOWED_COLUMNS[col]] += float(total)
                 
                 # Count games per team (number of unique opponents they faced)
                 for team in opponent_map.keys():
@@ -457,6 +899,30 @@ class EnhancedFootballDataProcessor:
         print(f"✅ Calculated defensive rankings for {len(rankings)} teams through Week {target_week-1}")
         return rankings
     
+    def _get_schedule_opponents(self) -> Dict[int, Dict[str, str]]:
+        """
+        OPTIMIZATION: Index schedule_data as week -> team -> opponent in one pass
+        
+        Rebuilt whenever schedule_data is reassigned.
+        """
+        if self._schedule_opponents is None or self._schedule_opponents_source is not self.schedule_data:
+            schedule_opponents = {}
+            schedule = self.schedule_data
+            
+            if (schedule is not None and not schedule.empty
+                    and {'week', 'home_team', 'away_team'}.issubset(schedule.columns)):
+                for week, home_team, away_team in zip(schedule['week'], schedule['home_team'],
+                                                      schedule['away_team']):
+                    if home_team and away_team:
+                        week_opponents = schedule_opponents.setdefault(week, {})
+                        week_opponents[home_team] = away_team
+                        week_opponents[away_team] = home_team
+            
+            self._schedule_opponents = schedule_opponents
+            self._schedule_opponents_source = schedule
+        
+        return self._schedule_opponents
+    
     def _get_opponent_map_for_week(self, week: int) -> Dict[str, str]:
         """
         Get mapping of team -> opponent for a specific week
@@ -468,22 +934,10 @@ class EnhancedFootballDataProcessor:
         Returns:
             Dictionary mapping team name to opponent name
         """
-        opponent_map = {}
-        
         # Try schedule data first
-        if self.schedule_data is not None and not self.schedule_data.empty:
-            week_games = self.schedule_data[self.schedule_data['week'] == week]
-            
-            for _, game in week_games.iterrows():
-                home_team = game.get('home_team', '')
-                away_team = game.get('away_team', '')
-                
-                if home_team and away_team:
-                    opponent_map[home_team] = away_team
-                    opponent_map[away_team] = home_team
-            
-            if opponent_map:
-                return opponent_map
+        opponent_map = dict(self._get_schedule_opponents().get(week, {}))
+        if opponent_map:
+            return opponent_map
         
         # Fallback: Load from historical odds JSON files in game_data folder
         game_data_path = f"2025/WEEK{week}/game_data"
@@ -507,6 +961,76 @@ class EnhancedFootballDataProcessor:
         
         return opponent_map
     
+    @staticmethod
+    def _box_score_parquet_path(box_score_path: str, data_dir: str = "data") -> str:
+        """Path of the Parquet cache copy of a 2025/WEEK*/box_score_debug.csv file"""
+        season_dir, week_dir = os.path.normpath(box_score_path).split(os.sep)[-3:-1]
+        return os.path.join(data_dir, BOX_SCORE_PARQUET_DIR, f"{season_dir}_{week_dir}.parquet")
+    
+    @staticmethod
+    def _read_box_score_csv(box_score_path: str, columns: Optional[List[str]] = None,
+                            data_dir: str = "data") -> pd.DataFrame:
+        """
+        Read a week's box score CSV, using a cached Parquet copy when it is up to date
+        
+        The first read of a CSV also writes a Parquet copy of it under
+        BOX_SCORE_PARQUET_DIR in the data directory. Later reads load that copy
+        instead of re-parsing the CSV, until the CSV is modified again. The copies
+        are cleared with the other caches by manage_cache.py and pyclean.py.
+        
+        Args:
+            box_score_path: Path to an existing box_score_debug.csv
+            columns: Columns to return (missing ones are skipped); None for all box score columns
+            data_dir: Cache directory the Parquet copies are kept under
+            
+        Returns:
+            DataFrame with the box score rows
+        """
+        parquet_path = EnhancedFootballDataProcessor._box_score_parquet_path(box_score_path, data_dir)
+        
+        try:
+            if os.path.getmtime(parquet_path) >= os.path.getmtime(box_score_path):
+                if columns is not None:
+                    # Column pruning - only the requested column chunks are read
+                    available = pq.read_schema(parquet_path).names
+                    return pq.read_table(parquet_path,
+                                         columns=[col for col in columns if col in available]).to_pandas()
+                return pq.read_table(parquet_path).to_pandas()
+        except FileNotFoundError:
+            pass  # No Parquet copy yet - read the CSV and write one
+        except pa.ArrowInvalid as e:
+            print(f"⚠️ Ignoring unreadable Parquet copy {parquet_path}: {e}")
+        
+        # Only read the columns the processor uses
+        with open(box_score_path, newline='') as f:
+            header = next(csv.reader(f), [])
+        box_score_columns = [col for col in header if col in BOX_SCORE_ARROW_TYPES]
+        read_options = pacsv.ReadOptions(use_threads=True, block_size=1 << 20)
+        
+        try:
+            # Known column types let the multi-threaded Arrow parser skip type inference
+            table = pacsv.read_csv(box_score_path, read_options=read_options,
+                                   convert_options=pacsv.ConvertOptions(
+                                       include_columns=box_score_columns,
+                                       column_types={col: BOX_SCORE_ARROW_TYPES[col] for col in box_score_columns},
+                                       strings_can_be_null=True))
+        except pa.ArrowInvalid:
+            # Older files with non-numeric stats - let Arrow infer types
+            table = pacsv.read_csv(box_score_path, read_options=read_options,
+                                   convert_options=pacsv.ConvertOptions(include_columns=box_score_columns,
+                                                                        strings_can_be_null=True))
+        
+        try:
+            # Zstd-compressed copy is a fraction of the CSV size and skips parsing next time
+            os.makedirs(os.path.dirname(parquet_path), exist_ok=True)
+            pq.write_table(table, parquet_path, compression='zstd')
+        except (OSError, pa.ArrowException) as e:
+            print(f"⚠️ Could not write Parquet copy of {box_score_path}: {e}")
+        
+        if columns is not None:
+            table = table.select([col for col in columns if col in table.column_names])
+        return table.to_pandas()
+    
     def scrape_week_data(self, week: int, force_refresh: bool = False) -> Dict[str, pd.DataFrame]:
         """Load data for a specific week from database"""
         
@@ -533,8 +1057,27 @@ class EnhancedFootballDataProcessor:
             return {}
     
     
+    def _get_week_data(self, week: int, force_refresh: bool = False) -> Dict[str, pd.DataFrame]:
+        """
+        scrape_week_data, memoized per week for the life of the processor
+        
+        Only weeks that returned data are kept, so a week whose box scores land later
+        is still picked up. force_refresh reloads the week.
+        """
+        if force_refresh or week not in self._week_data_cache:
+            week_data = self.scrape_week_data(week, force_refresh)
+            if not week_data:
+                return week_data
+            self._week_data_cache[week] = week_data
+        return self._week_data_cache[week]
+    
     def _process_scraped_data(self, master_df: pd.DataFrame, week: int) -> Dict[str, pd.DataFrame]:
-        """Process scraped data into our internal format"""
+        """
+        Process scraped data into our internal format
+        
+        master_df is renamed and given a week column in place (callers pass a freshly
+        loaded frame), so no copy of the week's data is made.
+        """
         processed_data = {}
         
         # Convert column names to match our expected format
@@ -550,17 +1093,16 @@ class EnhancedFootballDataProcessor:
             'rec_TD': 'Receiving TDs'
         }
         
-        # Rename columns
-        df = master_df.copy()
-        for old_col, new_col in column_mapping.items():
-            if old_col in df.columns:
-                df = df.rename(columns={old_col: new_col})
+        # Rename columns present in this frame, in place
+        present_columns = {old_col: new_col for old_col, new_col in column_mapping.items()
+                           if old_col in master_df.columns}
+        master_df.rename(columns=present_columns, inplace=True)
         
-        # Add week information
-        df['week'] = week
+        # Add week information (int16, the width the season arrays store weeks at)
+        master_df['week'] = np.int16(week)
         
         # Store the processed data
-        processed_data[f'week_{week}'] = df
+        processed_data[f'week_{week}'] = master_df
         
         return processed_data
     
@@ -571,6 +1113,11 @@ class EnhancedFootballDataProcessor:
         
         print(f"🔄 Updating season data for weeks: {weeks}")
         
+        if force_refresh:
+            # Drop in-memory copies of previously loaded box scores
+            self._week_data_cache = {}
+            self._player_games_cache = {}
+        
         all_week_data = {}
         
         for week in weeks:
@@ -581,7 +1128,7 @@ class EnhancedFootballDataProcessor:
                 continue
             
             # Scrape the week's data
-            week_data = self.scrape_week_data(week, force_refresh)
+            week_data = self._get_week_data(week, force_refresh)
             if week_data:
                 all_week_data.update(week_data)
         
@@ -596,6 +1143,10 @@ class EnhancedFootballDataProcessor:
             self._save_cache(self.player_season_stats, "player_season")
             self._save_cache(self.team_defensive_stats, "team_defensive")
             
+            # Compile the Numba kernels now rather than on the first scored prop
+            if NUMBA_AVAILABLE:
+                _warm_up_kernels()
+            
             print(f"✅ Updated season data with {len(all_week_data)} weeks")
         else:
             print("⚠️ No new data to update")
@@ -604,85 +1155,83 @@ class EnhancedFootballDataProcessor:
         """Build player season stats from weekly data including home/away splits"""
         print("📊 Building player season stats with home/away splits...")
         
-        # Combine all weeks with week numbers
-        all_games = []
-        for week_key, week_df in all_week_data.items():
-            if not week_df.empty:
-                # Extract week number from key (e.g., 'week_1' -> 1)
-                week_num = int(week_key.split('_')[1]) if '_' in week_key else 0
-                week_df_copy = week_df.copy()
-                week_df_copy['week'] = week_num
-                all_games.append(week_df_copy)
+        # Combine all weeks; each frame already carries its int16 'week' column
+        # (set once in _process_scraped_data)
+        all_games = [week_df for week_df in all_week_data.values() if not week_df.empty]
         
         if not all_games:
             return
         
-        combined_df = pd.concat(all_games, ignore_index=True)
+        # Single concat of the weekly frames (a lone week needs none). Row labels aren't
+        # used below, so keep them. The column selection below builds a new frame, so the
+        # cached week frames are never modified.
+        combined_df = all_games[0] if len(all_games) == 1 else pd.concat(all_games)
         
-        # Group by player and build season stats
-        player_stats = {}
+        stat_categories = PLAYER_STAT_TYPES
+        
+        # Keep only the columns used below
+        used_columns = ['player', 'team', 'week'] + stat_categories
+        combined_df = combined_df[[col for col in used_columns if col in combined_df.columns]]
         
+        stat_columns = [stat for stat in stat_categories if stat in combined_df.columns]
+        
+        # Dictionary-encode the repeated names once so the groupbys below work on integer codes
+        combined_df['player'] = combined_df['player'].astype('category')
+        combined_df['team'] = combined_df['team'].astype('category')
+        
+        # Convert stats to numeric once per column (non-numeric values become NaN and are dropped).
+        # Downcast to float32 here - the stored game logs are float32 anyway, and the
+        # melt below then moves half the bytes.
+        for stat in stat_columns:
+            combined_df[stat] = pd.to_numeric(combined_df[stat], errors='coerce', downcast='float')
+        
+        # Home/away for every row from the (team, week) venue map
+        combined_df['is_home'] = self._venue_series(combined_df['team'], combined_df['week'])
+        
+        # Index cleaned names as players are added rather than re-scanning the finished dict
+        player_stats = {}
+        player_name_index = {}
         for player in combined_df['player'].unique():
-            player_data = combined_df[combined_df['player'] == player]
-            
             player_stats[player] = {}
+            player_name_index[clean_player_name(player)] = player
+        
+        # Store team information (use most recent team if player changed teams)
+        for player, team in combined_df.groupby('player', sort=False, observed=True)['team'].last().dropna().items():
+            player_stats[player]['team'] = team
+        
+        # One row per (player, game, stat) with a value, grouped by stat then player
+        long_df = combined_df.melt(id_vars=['player', 'week', 'is_home'], value_vars=stat_columns,
+                                   var_name='stat', value_name='value').dropna(subset=['value'])
+        
+        values = long_df['value'].to_numpy(dtype=np.float32)
+        weeks = long_df['week'].to_numpy(dtype=np.int16)
+        home = long_df['is_home'].eq(True).to_numpy()
+        away = long_df['is_home'].eq(False).to_numpy()  # None (bye week or not found) is neither
+        
+        # Per-stat key names, built once and shared by every player's dict
+        stat_keys = {stat: tuple(sys.intern(f"{stat}{suffix}")
+                                 for suffix in ('_weeks', '_home', '_home_weeks', '_away', '_away_weeks'))
+                     for stat in stat_columns}
+        
+        for (stat, player), rows in long_df.groupby(['stat', 'player'], sort=False, observed=True).indices.items():
+            weeks_key, home_key, home_weeks_key, away_key, away_weeks_key = stat_keys[stat]
             
-            # Store team information (use most recent team if player changed teams)
-            if 'team' in player_data.columns:
-                team_values = player_data['team'].dropna()
-                if len(team_values) > 0:
-                    # Use the most recent team (last value)
-                    player_stats[player]['team'] = team_values.iloc[-1]
-            
-            # Calculate stats for each category
-            stat_categories = ['Passing Yards', 'Passing TDs', 'Rushing Yards', 'Rushing TDs', 
-                             'Receptions', 'Receiving Yards', 'Receiving TDs']
+            # All games - store both values and week numbers
+            player_stats[player][stat] = values[rows]
+            player_stats[player][weeks_key] = weeks[rows]
             
-            for stat in stat_categories:
-                if stat in player_data.columns:
-                    # Get non-null values for this stat with team and week info
-                    stat_data = player_data[['team', 'week', stat]].dropna(subset=[stat])
-                    
-                    if len(stat_data) > 0:
-                        # Convert to numeric and get actual values
-                        stat_data[stat] = pd.to_numeric(stat_data[stat], errors='coerce')
-                        stat_data = stat_data.dropna(subset=[stat])
-                        
-                        if len(stat_data) > 0:
-                            # All games - store both values and week numbers
-                            player_stats[player][stat] = stat_data[stat].tolist()
-                            player_stats[player][f"{stat}_weeks"] = stat_data['week'].tolist()
-                            
-                            # Split by home/away
-                            home_values = []
-                            home_weeks = []
-                            away_values = []
-                            away_weeks = []
-                            
-                            for _, row in stat_data.iterrows():
-                                team = row['team']
-                                week = row['week']
-                                value = row[stat]
-                                
-                                is_home = self.is_home_game(team, week)
-                                if is_home == True:
-                                    home_values.append(value)
-                                    home_weeks.append(week)
-                                elif is_home == False:
-                                    away_values.append(value)
-                                    away_weeks.append(week)
-                                # If None (bye week or not found), we skip it
-                            
-                            # Store home/away splits with week numbers
-                            if home_values:
-                                player_stats[player][f"{stat}_home"] = home_values
-                                player_stats[player][f"{stat}_home_weeks"] = home_weeks
-                            if away_values:
-                                player_stats[player][f"{stat}_away"] = away_values
-                                player_stats[player][f"{stat}_away_weeks"] = away_weeks
+            # Store home/away splits with week numbers
+            home_rows = rows[home[rows]]
+            if home_rows.size:
+                player_stats[player][home_key] = values[home_rows]
+                player_stats[player][home_weeks_key] = weeks[home_rows]
+            away_rows = rows[away[rows]]
+            if away_rows.size:
+                player_stats[player][away_key] = values[away_rows]
+                player_stats[player][away_weeks_key] = weeks[away_rows]
         
         self.player_season_stats = player_stats
-        self._rebuild_player_name_index()
+        self.player_name_index = player_name_index
         print(f"✅ Built season stats for {len(player_stats)} players with home/away splits")
     
     def _build_team_defensive_stats(self, all_week_data: Dict[str, pd.DataFrame]):
@@ -690,9 +1239,11 @@ class EnhancedFootballDataProcessor:
         print("🛡️ Building team defensive stats using ESPN and NFL.com data...")
         
         try:
-            # Use unified defensive scraper to get all defensive stats
-            defensive_scraper = DefensiveScraper()
-            defensive_data = defensive_scraper.update_defensive_stats()
+            defensive_data = self._ensure_defensive_data()
+            if defensive_data is None:
+                print("⚠️ Defensive data fetch failed recently, using fallback")
+                self._use_fallback_defensive_stats()
+                return
             
             # Extract yards rankings and TD data from combined defensive data
             yards_rankings = {team: {k: v for k, v in stats.items() if 'Allowed' in k and 'TDs' not in k}
@@ -720,6 +1271,41 @@ class EnhancedFootballDataProcessor:
             print("Using fallback defensive stats")
             self._use_fallback_defensive_stats()
     
+    @staticmethod
+    def _ensure_defensive_data() -> Optional[Dict]:
+        """
+        Get combined defensive data from DefensiveScraper, memoized in-process
+        
+        Successful results are reused for _DEFENSIVE_DATA_TTL_SECONDS, so repeated
+        update_season_data calls don't re-run the scraper. A failed or empty fetch is
+        remembered for _DEFENSIVE_DATA_NEGATIVE_TTL_SECONDS, during which None is returned
+        without touching the network.
+        
+        Returns:
+            Dict of team -> defensive stats, or None while a recent failure is cached
+        """
+        memo = _defensive_data_memo
+        now = time.time()
+        if memo['data'] is not None and now - memo['fetched_at'] < _DEFENSIVE_DATA_TTL_SECONDS:
+            return memo['data']
+        if now < memo['failed_until']:
+            return None
+        
+        try:
+            defensive_data = DefensiveScraper().update_defensive_stats()
+        except Exception as e:
+            print(f"⚠️ Error fetching defensive stats: {e}")
+            defensive_data = None
+        
+        if not defensive_data:
+            memo['failed_until'] = now + _DEFENSIVE_DATA_NEGATIVE_TTL_SECONDS
+            return None
+        
+        memo['data'] = defensive_data
+        memo['fetched_at'] = now
+        memo['failed_until'] = 0.0
+        return defensive_data
+    
     def _combine_defensive_data(self, yards_rankings: Dict, td_data: Dict) -> Dict:
         """Combine ESPN yards rankings with NFL.com TD data"""
         print("🔄 Combining yards and TD defensive data...")
@@ -787,140 +1373,110 @@ class EnhancedFootballDataProcessor:
             'TEN': 'Tennessee Titans', 'WAS': 'Washington Commanders'
         }
         
+        all_teams = list(team_mapping.values())
+        
+        # One row per team, one column per position's average DFS points
+        points = pd.DataFrame.from_dict(position_results, orient='index')
+        points.index = [team_mapping.get(team_abbrev, team_abbrev) for team_abbrev in points.index]
+        
+        def estimate_yards_allowed(position, points_to_yards, low, high, default):
+            """Map a position's DFS points to clipped yards allowed, with a default for missing teams"""
+            if position in points.columns:
+                position_points = points[position].dropna()
+            else:
+                position_points = pd.Series(dtype=float)
+            yards = np.clip(points_to_yards(position_points.to_numpy(dtype=float)), low, high).astype(int)
+            yards_allowed = dict(zip(position_points.index, yards.tolist()))
+            for team in all_teams:
+                yards_allowed.setdefault(team, default)
+            return yards_allowed
+        
         # Convert DFS points to approximate yards allowed
         # These are rough conversions based on typical DFS scoring
         defensive_stats = {
-            'Passing Yards Allowed': {},
-            'Rushing Yards Allowed': {},
-            'Receiving Yards Allowed': {}
+            # QB gets 0.04 points per yard + 4 per TD + bonuses
+            'Passing Yards Allowed': estimate_yards_allowed('QB', lambda qb_points: (qb_points - 10) * 25, 150, 400, 250),
+            # RB gets 0.1 points per yard + 6 per TD + 1 per reception
+            'Rushing Yards Allowed': estimate_yards_allowed('RB', lambda rb_points: rb_points * 8, 50, 200, 120),
+            # WR gets 0.1 points per yard + 6 per TD + 1 per reception
+            'Receiving Yards Allowed': estimate_yards_allowed('WR', lambda wr_points: wr_points * 6, 100, 350, 250)
         }
         
-        for team_abbrev, position_data in position_results.items():
-            full_team_name = team_mapping.get(team_abbrev, team_abbrev)
-            
-            # Convert QB DFS points to approximate passing yards allowed
-            if 'QB' in position_data:
-                # Rough conversion: QB DFS points to passing yards
-                # QB gets 0.04 points per yard + 4 per TD + bonuses
-                qb_points = position_data['QB']
-                # Estimate passing yards (this is approximate)
-                passing_yards = max(150, min(400, (qb_points - 10) * 25))  # Rough estimate
-                defensive_stats['Passing Yards Allowed'][full_team_name] = int(passing_yards)
-            
-            # Convert RB DFS points to approximate rushing yards allowed
-            if 'RB' in position_data:
-                # RB gets 0.1 points per yard + 6 per TD + 1 per reception
-                rb_points = position_data['RB']
-                # Estimate rushing yards (this is approximate)
-                rushing_yards = max(50, min(200, rb_points * 8))  # Rough estimate
-                defensive_stats['Rushing Yards Allowed'][full_team_name] = int(rushing_yards)
-            
-            # Convert WR DFS points to approximate receiving yards allowed
-            if 'WR' in position_data:
-                # WR gets 0.1 points per yard + 6 per TD + 1 per reception
-                wr_points = position_data['WR']
-                # Estimate receiving yards (this is approximate)
-                receiving_yards = max(100, min(350, wr_points * 6))  # Rough estimate
-                defensive_stats['Receiving Yards Allowed'][full_team_name] = int(receiving_yards)
-        
-        # Fill in missing teams with default values
-        all_teams = list(team_mapping.values())
-        for stat_type in defensive_stats:
-            for team in all_teams:
-                if team not in defensive_stats[stat_type]:
-                    # Default values based on stat type
-                    if 'Passing' in stat_type:
-                        defensive_stats[stat_type][team] = 250
-                    elif 'Rushing' in stat_type:
-                        defensive_stats[stat_type][team] = 120
-                    elif 'Receiving' in stat_type:
-                        defensive_stats[stat_type][team] = 250
-        
-        self.team_defensive_stats = defensive_stats
+        self.team_defensive_stats = self._rank_yards_allowed(defensive_stats)
         print(f"✅ Converted defensive stats for {len(defensive_stats['Passing Yards Allowed'])} teams")
     
     def _use_fallback_defensive_stats(self):
         """Use fallback defensive stats when real data is not available"""
-        team_defensive_rankings = {
-            'Passing Yards Allowed': {
-                'San Francisco 49ers': 195, 'Buffalo Bills': 205, 'New York Jets': 210,
-                'Pittsburgh Steelers': 215, 'New England Patriots': 220, 'Baltimore Ravens': 220,
-                'Cleveland Browns': 225, 'New Orleans Saints': 225, 'Cincinnati Bengals': 235,
-                'Kansas City Chiefs': 235, 'Minnesota Vikings': 235, 'Tampa Bay Buccaneers': 235,
-                'Philadelphia Eagles': 230, 'Los Angeles Rams': 230, 'Green Bay Packers': 230,
-                'Indianapolis Colts': 240, 'Miami Dolphins': 240, 'Tennessee Titans': 240,
-                'Atlanta Falcons': 240, 'Carolina Panthers': 230, 'Chicago Bears': 245,
-                'Detroit Lions': 245, 'Jacksonville Jaguars': 245, 'Los Angeles Chargers': 245,
-                'Seattle Seahawks': 245, 'Arizona Cardinals': 250, 'Dallas Cowboys': 250,
-                'Houston Texans': 250, 'Las Vegas Raiders': 250, 'Denver Broncos': 255,
-                'New York Giants': 250, 'Washington Commanders': 250
-            },
-            'Rushing Yards Allowed': {
-                'San Francisco 49ers': 85, 'Buffalo Bills': 90, 'New York Jets': 95,
-                'Pittsburgh Steelers': 95, 'New England Patriots': 100, 'Baltimore Ravens': 100,
-                'Cleveland Browns': 100, 'New Orleans Saints': 105, 'Cincinnati Bengals': 105,
-                'Kansas City Chiefs': 110, 'Minnesota Vikings': 110, 'Tampa Bay Buccaneers': 110,
-                'Philadelphia Eagles': 110, 'Los Angeles Rams': 110, 'Green Bay Packers': 115,
-                'Indianapolis Colts': 115, 'Miami Dolphins': 115, 'Tennessee Titans': 115,
-                'Atlanta Falcons': 115, 'Carolina Panthers': 110, 'Chicago Bears': 120,
-                'Detroit Lions': 120, 'Jacksonville Jaguars': 120, 'Los Angeles Chargers': 120,
-                'Seattle Seahawks': 120, 'Arizona Cardinals': 125, 'Dallas Cowboys': 125,
-                'Houston Texans': 125, 'Las Vegas Raiders': 125, 'Denver Broncos': 130,
-                'New York Giants': 130, 'Washington Commanders': 130
-            },
-            'Receiving Yards Allowed': {
-                'San Francisco 49ers': 195, 'Buffalo Bills': 205, 'New York Jets': 210,
-                'Pittsburgh Steelers': 215, 'New England Patriots': 220, 'Baltimore Ravens': 220,
-                'Cleveland Browns': 225, 'New Orleans Saints': 225, 'Cincinnati Bengals': 235,
-                'Kansas City Chiefs': 235, 'Minnesota Vikings': 235, 'Tampa Bay Buccaneers': 235,
-                'Philadelphia Eagles': 230, 'Los Angeles Rams': 230, 'Green Bay Packers': 230,
-                'Indianapolis Colts': 240, 'Miami Dolphins': 240, 'Tennessee Titans': 240,
-                'Atlanta Falcons': 240, 'Carolina Panthers': 230, 'Chicago Bears': 245,
-                'Detroit Lions': 245, 'Jacksonville Jaguars': 245, 'Los Angeles Chargers': 245,
-                'Seattle Seahawks': 245, 'Arizona Cardinals': 250, 'Dallas Cowboys': 250,
-                'Houston Texans': 250, 'Las Vegas Raiders': 250, 'Denver Broncos': 255,
-                'New York Giants': 250, 'Washington Commanders': 250
-            }
-        }
+        self.team_defensive_stats = self._rank_yards_allowed({
+            'Passing Yards Allowed': _FALLBACK_PASS_YARDS_ALLOWED,
+            'Rushing Yards Allowed': _FALLBACK_RUSH_YARDS_ALLOWED,
+            'Receiving Yards Allowed': _FALLBACK_PASS_YARDS_ALLOWED
+        })
+    
+    @staticmethod
+    def _rank_yards_allowed(yards_allowed: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, int]]:
+        """
+        Turn {stat: {team: yards allowed}} into the {team: {stat: rank}} layout of the ESPN rankings
+        
+        Fewest yards allowed ranks 1; tied teams share their average rank, rounded
+        (same convention as DefensiveScraper.calculate_rankings).
         
-        self.team_defensive_stats = team_defensive_rankings
+        Args:
+            yards_allowed: Yards allowed per team, keyed by defensive stat
+            
+        Returns:
+            Defensive rank per team and stat
+        """
+        rankings = {}
+        for defensive_stat, team_yards in yards_allowed.items():
+            ranks = np.round(pd.Series(team_yards, dtype=float).rank(method='average')).astype(int)
+            for team, rank in zip(ranks.index, ranks.tolist()):
+                rankings.setdefault(team, {})[defensive_stat] = rank
+        return rankings
     
     # Interface methods that match the original data processor
     def get_team_defensive_rank(self, team: str, stat_type: str) -> int:
         """Get team defensive ranking for a specific stat"""
         # Use historical rankings if max_week is set and we have the data
-        if self.max_week is not None and self.historical_defensive_stats:
-            return self._get_historical_team_defensive_rank(team, stat_type)
+        use_historical = self.max_week is not None and self.historical_defensive_stats
         
         # Otherwise use season-long rankings
-        if not self.team_defensive_stats:
+        if not use_historical and not self.team_defensive_stats:
             self.update_season_data()
         
+        # OPTIMIZATION: Memoize ranks until the rankings they came from are replaced
+        source = self._def_rank_cache_source
+        if (source is None or source[0] is not self.team_defensive_stats
+                or source[1] is not self.historical_defensive_stats or source[2] != self.max_week):
+            rankings = self.historical_defensive_stats if use_historical else self.team_defensive_stats
+            
+            # Flatten {team: {stat: rank}} into a (team, stat) -> rank table
+            self._def_rank_records = {(team_name, defensive_stat): rank
+                                      for team_name, stats in rankings.items() if isinstance(stats, dict)
+                                      for defensive_stat, rank in stats.items()}
+            # Case-insensitive fallback table; the first team spelling in the rankings wins
+            self._def_rank_records_lower = {}
+            for (team_name, defensive_stat), rank in self._def_rank_records.items():
+                self._def_rank_records_lower.setdefault((team_name.lower(), defensive_stat), rank)
+            self._def_rank_cache = {}
+            self._def_rank_cache_source = (self.team_defensive_stats, self.historical_defensive_stats, self.max_week)
+        
+        cache_key = (team, stat_type)
+        if cache_key not in self._def_rank_cache:
+            self._def_rank_cache[cache_key] = self._lookup_team_defensive_rank(team, stat_type)
+        return self._def_rank_cache[cache_key]
+    
+    def _lookup_team_defensive_rank(self, team: str, stat_type: str) -> int:
+        """Uncached lookup behind get_team_defensive_rank, against the flattened rank table"""
         # Convert stat type to defensive stat format (e.g., "Passing Yards" -> "Passing Yards Allowed")
-        # Map stat types to their defensive equivalents
-        # Note: ESPN doesn't have separate receiving stats, so we use passing stats as proxy
-        stat_mapping = {
-            'Passing Yards': 'Passing Yards Allowed',
-            'Passing TDs': 'Passing TDs Allowed',
-            'Rushing Yards': 'Rushing Yards Allowed',
-            'Rushing TDs': 'Rushing TDs Allowed',
-            'Receptions': 'Passing Yards Allowed',      # Use passing defense as proxy
-            'Receiving Yards': 'Passing Yards Allowed',  # Use passing defense as proxy
-            'Receiving TDs': 'Passing TDs Allowed'       # Use passing TDs as proxy
-        }
+        defensive_stat = DEFENSIVE_STAT_MAPPING.get(stat_type, stat_type + ' Allowed')
         
-        defensive_stat = stat_mapping.get(stat_type, stat_type + ' Allowed')
-        
-        # The ESPN data is organized by team first, then by stat type
-        if team in self.team_defensive_stats and defensive_stat in self.team_defensive_stats[team]:
-            return self.team_defensive_stats[team][defensive_stat]
+        if (team, defensive_stat) in self._def_rank_records:
+            return self._def_rank_records[(team, defensive_stat)]
         
         # Try case-insensitive matching
-        for team_name, stats in self.team_defensive_stats.items():
-            if team_name.lower() == team.lower() and defensive_stat in stats:
-                return stats[defensive_stat]
-        
-        return None  # Return None if team not found (will display as N/A)
+        # Return None if team not found (will display as N/A)
+        return self._def_rank_records_lower.get((team.lower(), defensive_stat))
     
     def get_position_defensive_rank(self, team: str, player_name: str, stat_type: str) -> int:
         """
@@ -938,200 +1494,312 @@ class EnhancedFootballDataProcessor:
         print(f"⚠️ BYPASSING defensive ranking calculation for {player_name} vs {team} ({stat_type})")
         return None
     
-    def _get_historical_team_defensive_rank(self, team: str, stat_type: str) -> int:
-        """Get historical defensive ranking for a team (used when max_week is set)"""
-        # Map stat types to defensive stat format
-        stat_mapping = {
-            'Passing Yards': 'Passing Yards Allowed',
-            'Passing TDs': 'Passing TDs Allowed',
-            'Rushing Yards': 'Rushing Yards Allowed',
-            'Rushing TDs': 'Rushing TDs Allowed',
-            'Receptions': 'Passing Yards Allowed',
-            'Receiving Yards': 'Passing Yards Allowed',
-            'Receiving TDs': 'Passing TDs Allowed'
-        }
-        
-        defensive_stat = stat_mapping.get(stat_type, stat_type + ' Allowed')
-        
-        # Look up in historical rankings
-        if team in self.historical_defensive_stats and defensive_stat in self.historical_defensive_stats[team]:
-            return self.historical_defensive_stats[team][defensive_stat]
-        
-        # Try case-insensitive matching
-        for team_name, stats in self.historical_defensive_stats.items():
-            if team_name.lower() == team.lower() and defensive_stat in stats:
-                return stats[defensive_stat]
-        
-        return None  # Return None if team not found (will display as N/A)
-    
-    def _filter_games_by_week(self, games: list, weeks: list) -> list:
+    def _filter_games_by_week(self, games: np.ndarray, weeks: np.ndarray) -> np.ndarray:
         """
         Filter games to include only those before max_week
         
         Args:
-            games: List of game stats
-            weeks: List of week numbers (same length as games)
+            games: Array of game stats
+            weeks: Array of week numbers (same length as games)
             
         Returns:
-            Filtered list of games
+            Filtered array of games
         """
-        if self.max_week is None or not weeks:
+        games = np.asarray(games)
+        if self.max_week is None or len(weeks) == 0:
             return games
         
         # Filter to only include games before max_week
-        filtered_games = [game for game, week in zip(games, weeks) if week < self.max_week]
-        return filtered_games if filtered_games else games  # Return all if filtered is empty
+        before_max_week = np.asarray(weeks)[:games.size] < self.max_week
+        if not before_max_week.any():
+            return games  # Return all if filtered is empty
+        if before_max_week.size == games.size and before_max_week.all():
+            return games  # Nothing to filter - skip the copy made by boolean indexing
+        return games[:before_max_week.size][before_max_week]
     
-    def _filter_games_by_week_with_weeks(self, games: list, weeks: list) -> list:
+    def _lookup_games(self, player: str, stat_type: str, venue: Optional[str] = None,
+                      filter_by_week: bool = True) -> Optional[np.ndarray]:
         """
-        Filter games to include only those before max_week, returning both games and weeks
+        Look up a player's game log for a stat, shared by the scalar accessors
         
         Args:
-            games: List of game stats
-            weeks: List of week numbers (same length as games)
+            player: Player name (cleaned before lookup)
+            stat_type: Type of stat (e.g., "Passing Yards")
+            venue: 'home' or 'away' for a venue split, None for all games
+            filter_by_week: Drop games from max_week onward (see _filter_games_by_week)
             
         Returns:
-            List of tuples [(game, week), ...] with filtered data
+            Array of game stats, or None if the player has no log for the stat
         """
-        if self.max_week is None or not weeks:
-            return list(zip(games, weeks))
+        if not self.player_season_stats:
+            self.update_season_data()
         
-        # Filter to only include games before max_week
-        filtered_data = [(game, week) for game, week in zip(games, weeks) if week < self.max_week]
-        return filtered_data if filtered_data else list(zip(games, weeks))  # Return all if filtered is empty
+        # Use index for fast lookup
+        player_key = self.player_name_index.get(clean_player_name(player))
+        if not player_key:
+            return None
+        
+        player_stats = self.player_season_stats[player_key]
+        stat_key = f"{stat_type}_{venue}" if venue else stat_type
+        games = player_stats.get(stat_key)
+        if games is None:
+            return None
+        
+        if filter_by_week:
+            return self._filter_games_by_week(games, player_stats.get(f"{stat_key}_weeks", []))
+        return np.asarray(games)
     
     def get_player_over_rate(self, player: str, stat_type: str, line: float) -> float:
         """Calculate how often a player has gone over a specific line this season
         Returns None if no data is available"""
+        sorted_games = self._get_sorted_games(player, stat_type)
+        if sorted_games is None or sorted_games.size == 0:
+            return None
+        
+        # OPTIMIZATION: Games over the line are everything after it in the sorted log
+        return int(sorted_games.size - np.searchsorted(sorted_games, line, side='right')) / sorted_games.size
+    
+    def _get_sorted_games(self, player: str, stat_type: str) -> Optional[np.ndarray]:
+        """
+        OPTIMIZATION: A player's season log for a stat (filtered by max_week), sorted once
+        
+        Reused for every line asked about until player_season_stats or max_week changes.
+        """
         if not self.player_season_stats:
             self.update_season_data()
         
-        # Import clean function
-        from utils import clean_player_name
+        source = (self.player_season_stats, self.max_week)
+        if (self._sorted_games_source is None or self._sorted_games_source[0] is not source[0]
+                or self._sorted_games_source[1] != source[1]):
+            self._sorted_games = {}
+            self._sorted_games_source = source
+        
+        cache_key = (player, stat_type)
+        if cache_key not in self._sorted_games:
+            games = self._lookup_games(player, stat_type)
+            self._sorted_games[cache_key] = None if games is None else np.sort(games)
+        return self._sorted_games[cache_key]
+    
+    @staticmethod
+    def _over_rate(games: Optional[np.ndarray], line: float) -> Optional[float]:
+        """Fraction of games over the line, or None if there are no games"""
+        if games is None or games.size == 0:
+            return None
+        return np.count_nonzero(games > line) / games.size
+    
+    def _get_stat_soa(self, stat_type: str) -> Dict:
+        """
+        OPTIMIZATION: All players' game logs for one stat as flat arrays (structure of arrays)
         
-        # Use index for fast lookup
-        cleaned_input = clean_player_name(player)
-        player_key = self.player_name_index.get(cleaned_input)
+        Player i's games are values[offsets[i]:offsets[i + 1]] (weeks likewise).
+        Rebuilt whenever player_season_stats is reassigned.
         
-        if player_key and stat_type in self.player_season_stats[player_key]:
-            games = self.player_season_stats[player_key][stat_type]
-            weeks = self.player_season_stats[player_key].get(f"{stat_type}_weeks", [])
-            
-            # Filter by max_week if set
-            games = self._filter_games_by_week(games, weeks)
+        Returns:
+            Dict with 'values' (float32), 'weeks' (int16), 'offsets' (int64) and
+            'player_index' (player key -> i)
+        """
+        if self._stat_soa_source is not self.player_season_stats:
+            self._stat_soa = {}
+            self._stat_soa_source = self.player_season_stats
+        
+        if stat_type not in self._stat_soa:
+            player_index = {}
+            value_chunks = []
+            week_chunks = []
+            for player_key, stats in self.player_season_stats.items():
+                games = stats.get(stat_type)
+                if games is None or len(games) == 0:
+                    continue
+                games = np.asarray(games, dtype=np.float32)
+                weeks = np.asarray(stats.get(f"{stat_type}_weeks", []), dtype=np.int16)
+                if weeks.size != games.size:
+                    weeks = np.full(games.size, np.iinfo(np.int16).min, dtype=np.int16)  # Week unknown
+                player_index[player_key] = len(value_chunks)
+                value_chunks.append(games)
+                week_chunks.append(weeks)
             
-            if games:
-                over_count = sum(1 for game_stat in games if game_stat > line)
-                return over_count / len(games)
+            lengths = np.array([chunk.size for chunk in value_chunks], dtype=np.int64)
+            self._stat_soa[stat_type] = {
+                'values': np.concatenate(value_chunks) if value_chunks else np.empty(0, dtype=np.float32),
+                'weeks': np.concatenate(week_chunks) if week_chunks else np.empty(0, dtype=np.int16),
+                'offsets': np.concatenate(([0], np.cumsum(lengths))),
+                'player_index': player_index
+            }
         
-        return None  # Return None if no data available
+        return self._stat_soa[stat_type]
     
-    def get_player_home_over_rate(self, player: str, stat_type: str, line: float) -> float:
-        """Calculate how often a player has gone over a specific line in home games
-        Returns None if no home game data is available"""
+    def get_player_over_rates_batch(self, stat_type: str, players: List[str], lines: List[float]) -> List[Optional[float]]:
+        """
+        Calculate season over rates for many (player, line) pairs in one NumPy pass
+        
+        Args:
+            stat_type: Type of stat (e.g., "Passing Yards")
+            players: Player names
+            lines: Line for each player (same length as players)
+            
+        Returns:
+            Over rate for each player, or None where no data is available
+            (same values as get_player_over_rate)
+        """
         if not self.player_season_stats:
             self.update_season_data()
         
-        # Import clean function
-        from utils import clean_player_name
+        soa = self._get_stat_soa(stat_type)
+        offsets = soa['offsets']
         
-        home_stat_key = f"{stat_type}_home"
+        # Segment index of each requested player, or -1 if they have no games for this stat
+        segments = np.array([soa['player_index'].get(self.player_name_index.get(clean_player_name(player)), -1)
+                             for player in players], dtype=np.int64)
+        found = segments >= 0
+        results = [None] * len(players)
+        if not found.any():
+            return results
         
-        # Use index for fast lookup
-        cleaned_input = clean_player_name(player)
-        player_key = self.player_name_index.get(cleaned_input)
+        segments = segments[found]
         
-        if player_key and home_stat_key in self.player_season_stats[player_key]:
-            games = self.player_season_stats[player_key][home_stat_key]
-            weeks = self.player_season_stats[player_key].get(f"{home_stat_key}_weeks", [])
-            
-            # Filter by max_week if set
-            games = self._filter_games_by_week(games, weeks)
+        if NUMBA_AVAILABLE:
+            # OPTIMIZATION: compare, count and divide in a single compiled pass per player
+            over_rates = _over_rates_kernel(soa['values'], soa['weeks'], offsets, segments,
+                                            np.asarray(lines, dtype=np.float64)[found],
+                                            -1 if self.max_week is None else self.max_week)
+            for position, over_rate in zip(np.flatnonzero(found), over_rates):
+                results[position] = float(over_rate)
+            return results
+        
+        starts = offsets[segments]
+        lengths = offsets[segments + 1] - starts
+        
+        # Row positions of every requested player's games, back to back
+        segment_starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        rows = np.repeat(starts - segment_starts, lengths) + np.arange(lengths.sum())
+        
+        values = soa['values'][rows]
+        line_per_game = np.repeat(np.asarray(lines, dtype=np.float64)[found], lengths)
+        
+        # Filter by max_week if set (players with no games before max_week keep all games)
+        counted = np.ones(rows.size, dtype=bool)
+        if self.max_week is not None:
+            before_max_week = soa['weeks'][rows] < self.max_week
+            has_games_before = np.add.reduceat(before_max_week, segment_starts) > 0
+            counted = before_max_week | np.repeat(~has_games_before, lengths)
+        
+        over_counts = np.add.reduceat((values > line_per_game) & counted, segment_starts)
+        game_counts = np.add.reduceat(counted, segment_starts)
+        
+        for position, over_rate in zip(np.flatnonzero(found), over_counts / game_counts):
+            results[position] = float(over_rate)
+        return results
+    
+    def score_props_bulk(self, props_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fill in per-prop player metrics for a whole slate of props
+        
+        Each player's game log is looked up once per stat type and reused for every
+        line they have, instead of once per metric per prop.
+        
+        Args:
+            props_df: Props with 'Player', 'Stat Type' and 'Line' columns
             
-            if games:
-                over_count = sum(1 for game_stat in games if game_stat > line)
-                return over_count / len(games)
+        Returns:
+            Copy of props_df with 'player_consistency', 'l5_over_rate' and 'streak' columns
+            (same values as get_player_consistency, get_player_last_n_over_rate and
+            get_player_streak; l5_over_rate is NaN where there is no data)
+        """
+        num_props = len(props_df)
+        consistency = [1.0] * num_props
+        l5_over_rate = np.full(num_props, np.nan)  # _over_rate's None (no data) stays NaN
+        streak = [0] * num_props
+        
+        if num_props and not self.player_season_stats:
+            self.update_season_data()
+        
+        players = props_df['Player'].to_numpy(dtype=object)
+        lines = props_df['Line'].to_numpy(dtype=object)
         
-        return None  # Return None if no home game data available
+        # Positions of each stat type's props; rows without a player keep the defaults
+        for stat_type, positions in props_df.groupby('Stat Type', sort=False).indices.items():
+            game_logs = {}
+            for position in positions:
+                player = players[position]
+                if pd.isna(player):
+                    continue
+                
+                if player not in game_logs:
+                    # Per-player inputs, computed once per stat type
+                    games = self._lookup_games(player, stat_type)
+                    game_logs[player] = (self.get_player_consistency(player, stat_type),
+                                         None if games is None else games[-5:],
+                                         self._get_streak_games(player, stat_type))
+                
+                player_consistency, last_5, streak_games = game_logs[player]
+                line = lines[position]
+                consistency[position] = player_consistency
+                over_rate = self._over_rate(last_5, line)
+                if over_rate is not None:
+                    l5_over_rate[position] = over_rate
+                if streak_games is not None:
+                    streak[position] = self._streak(*streak_games, line)
+        
+        return props_df.assign(player_consistency=consistency, l5_over_rate=l5_over_rate, streak=streak)
+    
+    def get_player_home_over_rate(self, player: str, stat_type: str, line: float) -> float:
+        """Calculate how often a player has gone over a specific line in home games
+        Returns None if no home game data is available"""
+        return self._over_rate(self._lookup_games(player, stat_type, venue='home'), line)
     
     def get_player_away_over_rate(self, player: str, stat_type: str, line: float) -> float:
         """Calculate how often a player has gone over a specific line in away games
         Returns None if no away game data is available"""
-        if not self.player_season_stats:
-            self.update_season_data()
-        
-        # Import clean function
-        from utils import clean_player_name
+        return self._over_rate(self._lookup_games(player, stat_type, venue='away'), line)
+    
+    def _get_stat_moments(self, player: str, stat_type: str) -> Optional[Tuple[int, float, float]]:
+        """
+        OPTIMIZATION: Season game count, mean and standard deviation of a player's stat
         
-        away_stat_key = f"{stat_type}_away"
+        Computed once per (player, stat_type) from the full season log (not filtered by
+        max_week) and reused until player_season_stats is reassigned.
         
-        # Use index for fast lookup
-        cleaned_input = clean_player_name(player)
-        player_key = self.player_name_index.get(cleaned_input)
+        Returns:
+            (games, mean, std), or None if the player has no games for the stat
+        """
+        if not self.player_season_stats:
+            self.update_season_data()
         
-        if player_key and away_stat_key in self.player_season_stats[player_key]:
-            games = self.player_season_stats[player_key][away_stat_key]
-            weeks = self.player_season_stats[player_key].get(f"{away_stat_key}_weeks", [])
-            
-            # Filter by max_week if set
-            games = self._filter_games_by_week(games, weeks)
-            
-            if games:
-                over_count = sum(1 for game_stat in games if game_stat > line)
-                return over_count / len(games)
+        if self._stat_moments_source is not self.player_season_stats:
+            self._stat_moments = {}
+            self._stat_moments_source = self.player_season_stats
         
-        return None  # Return None if no away game data available
+        cache_key = (player, stat_type)
+        if cache_key not in self._stat_moments:
+            games = self._lookup_games(player, stat_type, filter_by_week=False)
+            if games is None or games.size == 0:
+                self._stat_moments[cache_key] = None
+            else:
+                self._stat_moments[cache_key] = (games.size,
+                                                 float(np.mean(games, dtype=np.float64)),
+                                                 float(np.std(games, dtype=np.float64)))
+        return self._stat_moments[cache_key]
     
     def get_player_average(self, player: str, stat_type: str) -> float:
         """Get player's average for a specific stat this season
         Returns None if no data is available"""
-        if not self.player_season_stats:
-            self.update_season_data()
-        
-        # Import clean function
-        from utils import clean_player_name
-        
-        # Use index for fast lookup
-        cleaned_input = clean_player_name(player)
-        player_key = self.player_name_index.get(cleaned_input)
-        
-        if player_key and stat_type in self.player_season_stats[player_key]:
-            games = self.player_season_stats[player_key][stat_type]
-            if games:
-                return sum(games) / len(games)
-        
-        return None  # Return None if no data available
+        moments = self._get_stat_moments(player, stat_type)
+        if moments is None:
+            return None  # Return None if no data available
+        return moments[1]
     
     def get_player_consistency(self, player: str, stat_type: str) -> float:
         """Calculate player consistency (lower standard deviation = more consistent)"""
-        if not self.player_season_stats:
-            self.update_season_data()
-        
-        # Import clean function
-        from utils import clean_player_name
-        
-        # Use index for fast lookup
-        cleaned_input = clean_player_name(player)
-        player_key = self.player_name_index.get(cleaned_input)
-        
-        if player_key and stat_type in self.player_season_stats[player_key]:
-            games = self.player_season_stats[player_key][stat_type]
-            if len(games) < 2:
-                return 1.0
-            mean_val = sum(games) / len(games)
-            variance = sum((x - mean_val) ** 2 for x in games) / len(games)
-            return variance ** 0.5
-        
-        return 1.0  # Default high variance
+        moments = self._get_stat_moments(player, stat_type)
+        if moments is None or moments[0] < 2:
+            return 1.0  # Default high variance
+        return moments[2]
     
     def get_player_team(self, player: str) -> str:
         """Get the player's current team"""
         if not self.player_season_stats:
             self.update_season_data()
         
-        # Import clean function
-        from utils import clean_player_name
-        
         # Use index for fast lookup
         cleaned_input = clean_player_name(player)
         player_key = self.player_name_index.get(cleaned_input)
@@ -1178,30 +1846,10 @@ class EnhancedFootballDataProcessor:
         Returns:
             Over rate as a decimal (0.0 to 1.0), or None if no data available
         """
-        from utils import clean_player_name
-        cleaned_name = clean_player_name(player)
-        
-        # Use index for fast lookup
-        player_key = self.player_name_index.get(cleaned_name)
+        games = self._lookup_games(player, stat_type)
         
-        if not player_key or stat_type not in self.player_season_stats[player_key]:
-            return None
-        
-        player_stats = self.player_season_stats[player_key][stat_type]
-        weeks = self.player_season_stats[player_key].get(f"{stat_type}_weeks", [])
-        
-        # Filter by max_week if set
-        player_stats = self._filter_games_by_week(player_stats, weeks)
-        
-        if not player_stats or len(player_stats) == 0:
-            return None
-        
-        # Get the last N games (from filtered data)
-        last_n_games = player_stats[-n:] if len(player_stats) >= n else player_stats
-        
-        # Calculate over rate
-        over_count = sum(1 for stat in last_n_games if stat > line)
-        return over_count / len(last_n_games)
+        # Over rate of the last N games (from filtered data)
+        return self._over_rate(None if games is None else games[-n:], line)
     
     def get_player_streak(self, player: str, stat_type: str, line: float) -> int:
         """
@@ -1216,51 +1864,76 @@ class EnhancedFootballDataProcessor:
         Returns:
             Number of consecutive games over the line (0 if last game was under or if 2+ games missed)
         """
-        from utils import clean_player_name
+        streak_games = self._get_streak_games(player, stat_type)
+        if streak_games is None:
+            return 0
+        return self._streak(*streak_games, line)
+    
+    def _get_streak_games(self, player: str, stat_type: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Games and weeks a streak is counted over (filtered by max_week)
+        
+        Returns:
+            (stats, weeks) arrays, or None if the player has no games with a recorded week
+        """
         cleaned_name = clean_player_name(player)
         
         # Use index for fast lookup
         player_key = self.player_name_index.get(cleaned_name)
         
         if not player_key or stat_type not in self.player_season_stats[player_key]:
-            return 0
+            return None
         
         player_stats = self.player_season_stats[player_key][stat_type]
         weeks = self.player_season_stats[player_key].get(f"{stat_type}_weeks", [])
         
-        # Filter by max_week if set
-        filtered_data = self._filter_games_by_week_with_weeks(player_stats, weeks)
-        
-        if not filtered_data or len(filtered_data) == 0:
-            return 0
+        # Pair games with their weeks (games without a recorded week can't be placed)
+        num_games = min(len(player_stats), len(weeks))
+        if num_games == 0:
+            return None
         
-        # Extract filtered stats and weeks
-        filtered_stats = [item[0] for item in filtered_data]
-        filtered_weeks = [item[1] for item in filtered_data]
+        stats_arr = np.asarray(player_stats[:num_games], dtype=np.float64)
+        weeks_arr = np.asarray(weeks[:num_games])
         
-        streak = 0
-        previous_week = None
+        # Filter by max_week if set (keep all games if none are before max_week)
+        if self.max_week is not None:
+            before_max_week = weeks_arr < self.max_week
+            if before_max_week.any():
+                stats_arr = stats_arr[before_max_week]
+                weeks_arr = weeks_arr[before_max_week]
         
-        # Count backwards from most recent game
-        for i in range(len(filtered_stats) - 1, -1, -1):
-            stat_value = filtered_stats[i]
-            current_week = filtered_weeks[i]
-            
-            # Check if player went over the line
-            if stat_value > line:
-                # Check for gap in weeks (if not the first game in streak)
-                if previous_week is not None:
-                    week_gap = previous_week - current_week
-                    # If gap is 2 or more weeks, reset streak
-                    if week_gap >= 3:  # Gap of 3 means 2 weeks missed (e.g., played week 6, then week 3 = missed weeks 4 and 5)
-                        break
-                
-                streak += 1
-                previous_week = current_week
-            else:
-                break  # Stop at first game that didn't go over
+        return stats_arr, weeks_arr
+    
+    @staticmethod
+    def _streak(stats_arr: np.ndarray, weeks_arr: np.ndarray, line: float) -> int:
+        """Consecutive games over the line, from the most recent game (see get_player_streak)"""
+        if NUMBA_AVAILABLE:
+            # OPTIMIZATION: compiled backward walk, stopping at the first break
+            return int(_streak_kernel(stats_arr, weeks_arr, float(line)))
+        
+        # Walk backwards from most recent game: the streak stops at the first game
+        # that didn't go over, or at a gap of 3+ weeks between consecutive games
+        # (gap of 3 means 2 weeks missed, e.g. played week 6, then week 3)
+        over_desc = stats_arr[::-1] > line
+        weeks_desc = weeks_arr[::-1]
+
+        stop = ~over_desc
+        stop[1:] |= (weeks_desc[:-1] - weeks_desc[1:]) >= 3
+
+        if not stop.any():
+            return int(stop.size)
+        return int(np.argmax(stop))
+    
+    @staticmethod
+    def _game_values_to_list(values) -> list:
+        """
+        Convert a float32 game log slice to a plain list for callers
         
-        return streak
+        Whole-number stats come back as ints ([251, 252], not [251.0, 252.0]), matching
+        the lists the game logs held before they became float32 arrays.
+        """
+        return [int(value) if isinstance(value, float) and value.is_integer() else value
+                for value in np.asarray(values).tolist()]
     
     def get_player_last_n_games(self, player: str, stat_type: str, n: int = 5) -> list:
         """
@@ -1272,56 +1945,19 @@ class EnhancedFootballDataProcessor:
             n: Number of recent games to get (default: 5)
             
         Returns:
-            List of stat values for the last N games (most recent last)
+            List of stat values for the last N games (most recent last); whole numbers are ints
         """
-        from utils import clean_player_name
         cleaned_name = clean_player_name(player)
         
-        # Find player's stats
-        player_stats = None
-        for stored_player, stats in self.player_season_stats.items():
-            cleaned_stored = clean_player_name(stored_player)
-            if cleaned_stored == cleaned_name and stat_type in stats:
-                player_stats = stats[stat_type]
-                break
+        # Use index for fast lookup
+        player_key = self.player_name_index.get(cleaned_name)
+        player_stats = self.player_season_stats[player_key].get(stat_type) if player_key else None
         
-        if not player_stats or len(player_stats) == 0:
+        if player_stats is None or len(player_stats) == 0:
             return []
         
         # Get the last N games
-        last_n_games = player_stats[-n:] if len(player_stats) >= n else player_stats
-        
-        return last_n_games
-    
-    def _load_all_week_data(self) -> Dict[str, pd.DataFrame]:
-        """Load all available week data from database"""
-        all_week_data = {}
-        
-        if self.db_loader:
-            # Use database to load all available weeks
-            try:
-                available_weeks = self.db_loader.get_available_weeks()
-                
-                for week in available_weeks:
-                    if self.max_week and week > self.max_week:
-                        continue  # Skip weeks beyond max_week
-                    
-                    try:
-                        week_data = self.scrape_week_data(week, force_refresh=False)
-                        if week_data:
-                            all_week_data.update(week_data)
-                    except Exception as e:
-                        # Skip weeks that can't be loaded
-                        continue
-                        
-            except Exception as e:
-                print(f"❌ Error loading data from database: {e}")
-                return {}
-        else:
-            print("❌ No database loader available")
-            return {}
-        
-        return all_week_data
+        return self._game_values_to_list(np.asarray(player_stats)[-n:])
     
     def _load_player_specific_data(self, cleaned_name: str, stat_type: str) -> pd.DataFrame:
         """
@@ -1331,40 +1967,104 @@ class EnhancedFootballDataProcessor:
         if not self.db_loader:
             return pd.DataFrame()
         
+        # Repeated lookups for the same player/stat are served from memory
+        cache_key = (cleaned_name, stat_type)
+        if cache_key in self._player_games_cache:
+            return self._player_games_cache[cache_key]
+        
         try:
             from database.database_models import BoxScore
             from database.database_manager import DatabaseManager
             
             db_manager = DatabaseManager()
             with db_manager.get_session() as session:
-                # Query only the specific player's records
-                player_records = session.query(BoxScore).filter(
+                # Query only the specific player's records, and only the columns we use,
+                # so no ORM objects are built for rows we immediately flatten
+                player_records = session.query(
+                    BoxScore.player,
+                    BoxScore.team,
+                    BoxScore.week,
+                    BoxScore.actual_result
+                ).filter(
                     BoxScore.player == cleaned_name,
                     BoxScore.stat_type == stat_type
                 ).order_by(BoxScore.week.desc()).all()
                 
                 if not player_records:
-                    return pd.DataFrame()
+                    self._player_games_cache[cache_key] = pd.DataFrame()
+                    return self._player_games_cache[cache_key]
                 
                 # Convert to DataFrame
-                data = []
-                for record in player_records:
-                    row = {
-                        'player': record.player,
-                        'team': record.team,
-                        'week': record.week,
-                        stat_type: record.actual_result
-                    }
-                    data.append(row)
-                
-                df = pd.DataFrame(data)
+                df = pd.DataFrame.from_records(player_records, columns=['player', 'team', 'week', stat_type])
                 print(f"✅ Loaded {len(df)} games for {cleaned_name} - {stat_type}")
-                return df
+                self._player_games_cache[cache_key] = self._prepare_player_games(df, stat_type)
+                return self._player_games_cache[cache_key]
                 
         except Exception as e:
             print(f"❌ Error loading player data for {cleaned_name}: {e}")
             return pd.DataFrame()
     
+    @staticmethod
+    def _prepare_player_games(player_games: pd.DataFrame, stat_type: str) -> pd.DataFrame:
+        """
+        Normalize a player's games for one stat before caching them
+        
+        Drops games without a numeric value and orders games by week (oldest first), so
+        lookups can take the last N rows directly.
+        """
+        # Database values are already numeric; only coerce mixed/text columns, then drop
+        # missing and non-numeric values in a single pass
+        if not pd.api.types.is_numeric_dtype(player_games[stat_type]):
+            player_games = player_games.assign(**{stat_type: pd.to_numeric(player_games[stat_type], errors='coerce')})
+        player_games = player_games.dropna(subset=[stat_type])
+        if 'week' in player_games.columns:
+            player_games = player_games.sort_values('week', kind='stable')
+        return player_games.reset_index(drop=True)
+    
+    def _load_players_specific_data(self, cleaned_names: List[str], stat_type: str):
+        """
+        OPTIMIZATION: Load several players' data for one stat in a single database query
+        
+        Results are stored in the same per-player cache _load_player_specific_data reads from,
+        so later per-player lookups for these players don't hit the database.
+        """
+        if not self.db_loader:
+            return
+        
+        missing_names = list(dict.fromkeys(name for name in cleaned_names
+                                           if (name, stat_type) not in self._player_games_cache))
+        if not missing_names:
+            return
+        
+        try:
+            from database.database_models import BoxScore
+            from database.database_manager import DatabaseManager
+            
+            db_manager = DatabaseManager()
+            with db_manager.get_session() as session:
+                player_records = session.query(
+                    BoxScore.player,
+                    BoxScore.team,
+                    BoxScore.week,
+                    BoxScore.actual_result
+                ).filter(
+                    BoxScore.player.in_(missing_names),
+                    BoxScore.stat_type == stat_type
+                ).order_by(BoxScore.player, BoxScore.week.desc()).all()
+            
+            df = pd.DataFrame.from_records(player_records, columns=['player', 'team', 'week', stat_type])
+            for cleaned_name, player_games in df.groupby('player', sort=False):
+                self._player_games_cache[(cleaned_name, stat_type)] = self._prepare_player_games(player_games, stat_type)
+            
+            # Players without records get an empty frame, same as a per-player query
+            for cleaned_name in missing_names:
+                self._player_games_cache.setdefault((cleaned_name, stat_type), pd.DataFrame())
+            
+            print(f"✅ Loaded {len(df)} games for {len(missing_names)} players - {stat_type}")
+                
+        except Exception as e:
+            print(f"❌ Error loading player data for {len(missing_names)} players: {e}")
+    
     def _get_cached_opponent_mapping(self):
         """
         OPTIMIZATION: Cache opponent mapping to avoid repeated database queries
@@ -1375,6 +2075,33 @@ class EnhancedFootballDataProcessor:
             print("✅ Opponent mapping cached for future use")
         return self._cached_opponent_mapping
     
+    def _get_game_context_df(self) -> pd.DataFrame:
+        """
+        OPTIMIZATION: Build a (team, week) game context table once for joining against game logs
+        
+        Returns:
+            DataFrame with columns team, week, opponent_full, opponent (abbreviation),
+            is_home and game_date (MM/DD)
+        """
+        if self._game_context_df is None:
+            rows = []
+            for week, teams in self._get_cached_opponent_mapping().items():
+                for team, opponent_info in teams.items():
+                    opponent_full = opponent_info.get('opponent', 'Unknown')
+                    rows.append({
+                        'team': team,
+                        'week': week,
+                        'opponent_full': opponent_full,
+                        'opponent': get_team_abbreviation(opponent_full),
+                        'is_home': opponent_info.get('is_home', None),
+                        'game_date': opponent_info.get('game_date', '')
+                    })
+            
+            columns = ['team', 'week', 'opponent_full', 'opponent', 'is_home', 'game_date']
+            self._game_context_df = pd.DataFrame(rows, columns=columns).astype({'week': 'int64'})
+        
+        return self._game_context_df
+    
     def get_player_last_n_games_detailed(self, player: str, stat_type: str, n: int = 5) -> list:
         """
         Get detailed game information for the last N games including opponents and ranks
@@ -1387,9 +2114,18 @@ class EnhancedFootballDataProcessor:
         Returns:
             List of dicts with 'value', 'opponent', 'is_home', 'defensive_rank' for last N games
         """
-        from utils import clean_player_name, get_team_abbreviation
         cleaned_name = clean_player_name(player)
         
+        # OPTIMIZATION: Skip the database query when season stats show the player has no games
+        # for this stat (season stats are built from the same box scores)
+        if self.player_season_stats:
+            player_key = self.player_name_index.get(cleaned_name)
+            if not player_key:
+                print(f"⚠️ No games found for player {player}")
+                return []
+            if stat_type not in self.player_season_stats[player_key]:
+                return []
+        
         # OPTIMIZATION: Load only the specific player's data instead of all weeks
         player_games = self._load_player_specific_data(cleaned_name, stat_type)
         
@@ -1401,48 +2137,33 @@ class EnhancedFootballDataProcessor:
         if stat_type not in player_games.columns:
             return []
         
-        player_games = player_games.dropna(subset=[stat_type])
-        player_games[stat_type] = pd.to_numeric(player_games[stat_type], errors='coerce')
-        player_games = player_games.dropna(subset=[stat_type])
-        
-        # Sort by week to get chronological order
-        if 'week' in player_games.columns:
-            player_games = player_games.sort_values('week')
-        
-        # Get last N games
+        # Cached games are numeric and in week order (see _prepare_player_games)
         last_n_games = player_games.tail(n)
         
-        # OPTIMIZATION: Use cached opponent mapping
-        opponent_mapping = self._get_cached_opponent_mapping()
-        
-        game_details = []
-        for _, game in last_n_games.iterrows():
-            team = game.get('team', 'Unknown')
-            week = game.get('week', 0)
-            value = game[stat_type]
-            
-            # Get opponent info from cached mapping
-            opponent_info = opponent_mapping.get(week, {}).get(team, {})
-            opponent_full = opponent_info.get('opponent', 'Unknown')
-            is_home = opponent_info.get('is_home', None)
-            game_time = opponent_info.get('game_time')
-            
-            # Convert full name to abbreviation for display
-            opponent_abbrev = get_team_abbreviation(opponent_full)
-            
-            # Get defensive rank for opponent against this stat (using full name)
-            defensive_rank = self.get_team_defensive_rank(opponent_full, stat_type)
-            
-            # Get game date in MM/DD format
-            game_date = self.get_game_date(team, week)
-            
-            game_details.append({
-                'value': value,
-                'opponent': opponent_abbrev,  # Abbreviation for display
-                'is_home': is_home,
-                'defensive_rank': defensive_rank,
-                'game_date': game_date
-            })
+        # OPTIMIZATION: Join against the precomputed game context instead of per-game lookups
+        games = last_n_games.merge(self._get_game_context_df(), on=['team', 'week'], how='left')
+        
+        # Games missing from the opponent mapping display as Unknown
+        unknown = games['opponent_full'].isna()
+        if unknown.any():
+            games.loc[unknown, 'opponent_full'] = 'Unknown'
+            games.loc[unknown, 'opponent'] = get_team_abbreviation('Unknown')
+            games.loc[unknown, 'game_date'] = ''
+        
+        # Get defensive rank once per opponent against this stat (using full name)
+        defensive_ranks = {opponent: self.get_team_defensive_rank(opponent, stat_type)
+                           for opponent in games['opponent_full'].unique()}
+        
+        # Build the records column-wise; ranks and home flags stay Python objects (None when unknown)
+        game_details = pd.DataFrame({
+            'value': games[stat_type],
+            'opponent': games['opponent'],  # Abbreviation for display
+            'is_home': pd.Series([None if pd.isna(is_home) else bool(is_home) for is_home in games['is_home']],
+                                 index=games.index, dtype=object),
+            'defensive_rank': pd.Series([defensive_ranks[opponent] for opponent in games['opponent_full']],
+                                        index=games.index, dtype=object),
+            'game_date': games['game_date']
+        }).to_dict('records')
         
         return game_details
     
@@ -1461,28 +2182,63 @@ class EnhancedFootballDataProcessor:
             print(f"Error getting opposing team for {player_team}: {e}")
             return "Unknown"
     
+    @staticmethod
+    def _format_game_date(game_time) -> str:
+        """Format a game's commence time (datetime or ISO string) as MM/DD"""
+        if not game_time:
+            return ""
+        
+        try:
+            if isinstance(game_time, str):
+                # Parse ISO format datetime (e.g., "2025-10-07T00:16:00Z")
+                game_time = datetime.fromisoformat(game_time.replace('Z', '+00:00'))
+            return game_time.strftime("%m/%d")
+        except (ValueError, AttributeError):
+            return ""
+    
     def get_game_date(self, team: str, week: int = None) -> str:
         """Get the game date for a team and week in MM/DD format"""
         if week is None:
             week = self.current_week
         
-        try:
-            # Use opponent mapping from game data
-            if week in self.opponent_mapping and team in self.opponent_mapping[week]:
-                game_time = self.opponent_mapping[week][team]['game_time']
-                if game_time:
-                    # Parse ISO format datetime (e.g., "2025-10-07T00:16:00Z")
-                    try:
-                        date_obj = datetime.fromisoformat(game_time.replace('Z', '+00:00'))
-                        # Return in MM/DD format
-                        return date_obj.strftime("%m/%d")
-                    except:
-                        pass
+        # Dates are formatted when the opponent mapping is built
+        return self.opponent_mapping.get(week, {}).get(team, {}).get('game_date', "")
+    
+    def _get_matchup_index(self) -> Dict[Tuple[str, str], Dict]:
+        """
+        OPTIMIZATION: Index the schedule by matchup for O(1) lookups
+        
+        Both (home, away) and (away, home) map to the first scheduled game between
+        the two teams. The index is rebuilt whenever schedule_data is reassigned.
+        """
+        if self._matchup_index is None or self._matchup_index_source is not self.schedule_data:
+            matchup_index = {}
+            schedule = self.schedule_data
             
-            return ""
-        except Exception as e:
-            print(f"Error getting game date for {team}: {e}")
-            return ""
+            if schedule is not None and not schedule.empty:
+                dates = schedule['Date'] if 'Date' in schedule.columns else ['Unknown'] * len(schedule)
+                times = schedule['Time (ET)'] if 'Time (ET)' in schedule.columns else ['Unknown'] * len(schedule)
+                
+                # Strip team names column-wise rather than per row
+                homes = schedule['Home'].str.strip()
+                aways = schedule['Away'].str.strip()
+                
+                for week, home_team, away_team, game_date, game_time in zip(schedule['Week'], homes, aways,
+                                                                             dates, times):
+                    game = {
+                        'week': int(week),
+                        'home_team': home_team,
+                        'away_team': away_team,
+                        'date': game_date,
+                        'time': game_time
+                    }
+                    matchup_index.setdefault((home_team, away_team), game)
+                    matchup_index.setdefault((away_team, home_team), game)
+            
+            self._matchup_index = matchup_index
+            self._matchup_index_source = schedule
+        
+        return self._matchup_index
     
     def get_week_from_matchup(self, team1: str, team2: str) -> Optional[int]:
         """
@@ -1496,20 +2252,8 @@ class EnhancedFootballDataProcessor:
             Week number if matchup found, None otherwise
         """
         try:
-            if self.schedule_data is None or self.schedule_data.empty:
-                return None
-            
-            # Search for matchup in either direction (home vs away or away vs home)
-            for _, game in self.schedule_data.iterrows():
-                home_team = game['Home'].strip()
-                away_team = game['Away'].strip()
-                
-                # Check if teams match in either direction
-                if (home_team == team1 and away_team == team2) or \
-                   (home_team == team2 and away_team == team1):
-                    return int(game['Week'])
-            
-            return None
+            # Matchup index covers both directions (home vs away or away vs home)
+            return self._get_matchup_index().get((team1, team2), {}).get('week')
             
         except Exception as e:
             print(f"⚠️ Error finding week from matchup: {e}")
@@ -1527,32 +2271,38 @@ class EnhancedFootballDataProcessor:
             Dict with week, home_team, away_team, date, time, or None if not found
         """
         try:
-            if self.schedule_data is None or self.schedule_data.empty:
+            game = self._get_matchup_index().get((team1, team2))
+            if game is None:
                 return None
             
-            # Search for matchup
-            for _, game in self.schedule_data.iterrows():
-                home_team = game['Home'].strip()
-                away_team = game['Away'].strip()
-                
-                # Check if teams match in either direction
-                if (home_team == team1 and away_team == team2) or \
-                   (home_team == team2 and away_team == team1):
-                    return {
-                        'week': int(game['Week']),
-                        'home_team': home_team,
-                        'away_team': away_team,
-                        'date': game.get('Date', 'Unknown'),
-                        'time': game.get('Time (ET)', 'Unknown'),
-                        'is_team1_home': (home_team == team1)
-                    }
-            
-            return None
+            return {
+                **game,
+                'is_team1_home': (game['home_team'] == team1)
+            }
             
         except Exception as e:
             print(f"⚠️ Error getting matchup details: {e}")
             return None
     
+    def get_player_last_n_games_detailed_bulk(self, players: List[str], stat_type: str, n: int = 5) -> Dict[str, list]:
+        """
+        Get detailed game information for the last N games of several players at once
+        
+        All players' games are loaded with one database query instead of one per player.
+        
+        Args:
+            players: Player names
+            stat_type: Type of stat (e.g., "Passing Yards")
+            n: Number of recent games to get (default: 5)
+            
+        Returns:
+            Dict mapping each player name to their list of game details
+            (same format as get_player_last_n_games_detailed)
+        """
+        self._load_players_specific_data([clean_player_name(player) for player in players], stat_type)
+        
+        return {player: self.get_player_last_n_games_detailed(player, stat_type, n) for player in players}
+    
     def get_player_detailed_stats(self, player: str) -> Dict:
         """Get detailed stats for a player (for dashboard display)"""
         if not self.player_season_stats:
@@ -1565,18 +2315,85 @@ class EnhancedFootballDataProcessor:
         detailed_stats = {}
         
         for stat_type, values in player_data.items():
-            if values:
-                detailed_stats[stat_type] = {
-                    'games': len(values),
-                    'average': sum(values) / len(values),
-                    'min': min(values),
-                    'max': max(values),
-                    'values': values,
-                    'consistency': np.std(values) if len(values) > 1 else 0
-                }
+            # Skip non-array entries such as the player's team
+            if isinstance(values, str) or len(values) == 0:
+                continue
+            
+            # OPTIMIZATION: Let NumPy do the reductions, accumulating in float64.
+            # Whole-number values, min and max are returned as ints.
+            arr = np.asarray(values, dtype=np.float64)
+            game_values = self._game_values_to_list(values)
+            detailed_stats[stat_type] = {
+                'games': arr.size,
+                'average': float(arr.mean()),
+                'min': min(game_values),
+                'max': max(game_values),
+                'values': game_values,
+                'consistency': float(arr.std()) if arr.size > 1 else 0.0
+            }
         
         return detailed_stats
     
+    def get_player_detailed_stats_bulk(self, players: List[str],
+                                       stat_types: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Season summary stats for many players at once (for dashboard tables)
+        
+        Each stat is reduced for all requested players in one NumPy pass over its
+        SoA arrays (see _get_stat_soa) instead of one small dict per player.
+        
+        Args:
+            players: Player names (exact keys, or matched ignoring case after cleaning)
+            stat_types: Stat types to summarize (default: PLAYER_STAT_TYPES)
+            
+        Returns:
+            DataFrame indexed by (player, stat) with games, average, min, max and consistency
+            columns (as in get_player_detailed_stats); players or stats without games are omitted
+        """
+        if not self.player_season_stats:
+            self.update_season_data()
+        
+        # Requested name -> stored player key
+        player_keys = {}
+        for player in dict.fromkeys(players):
+            player_key = player if player in self.player_season_stats else self.get_player_key_case_insensitive(player)
+            if player_key:
+                player_keys[player] = player_key
+        
+        frames = []
+        for stat_type in (stat_types or PLAYER_STAT_TYPES):
+            soa = self._get_stat_soa(stat_type)
+            requested = [(player, soa['player_index'][player_key]) for player, player_key in player_keys.items()
+                         if player_key in soa['player_index']]
+            if not requested:
+                continue
+            
+            segments = np.array([segment for _, segment in requested], dtype=np.int64)
+            starts = soa['offsets'][segments]
+            lengths = soa['offsets'][segments + 1] - starts
+            
+            # Gather the requested players' games back to back, then reduce per player
+            segment_starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            rows = np.repeat(starts - segment_starts, lengths) + np.arange(lengths.sum())
+            values = soa['values'][rows].astype(np.float64)
+            
+            average = np.add.reduceat(values, segment_starts) / lengths
+            variance = np.add.reduceat((values - np.repeat(average, lengths)) ** 2, segment_starts) / lengths
+            frames.append(pd.DataFrame({
+                'player': [player for player, _ in requested],
+                'stat': stat_type,
+                'games': lengths,
+                'average': average,
+                'min': np.minimum.reduceat(values, segment_starts),
+                'max': np.maximum.reduceat(values, segment_starts),
+                'consistency': np.where(lengths > 1, np.sqrt(variance), 0.0)
+            }))
+        
+        if not frames:
+            return pd.DataFrame(columns=['games', 'average', 'min', 'max', 'consistency'],
+                                index=pd.MultiIndex.from_arrays([[], []], names=['player', 'stat']))
+        return pd.concat(frames, ignore_index=True).set_index(['player', 'stat'])
+    
     def get_available_players(self) -> List[str]:
         """Get list of all available players"""
         if not self.player_season_stats:
@@ -1590,8 +2407,8 @@ class EnhancedFootballDataProcessor:
             self.update_season_data()
         
         total_players = len(self.player_season_stats)
-        total_games = sum(len(values) for player_data in self.player_season_stats.values() 
-                         for values in player_data.values())
+        # Game log entries across all stats, read off the per-stat SoA arrays
+        total_games = sum(self._get_stat_soa(stat_type)['values'].size for stat_type in PLAYER_STAT_TYPES)
         
         return {
             'total_players': total_players,
@@ -1613,12 +2430,7 @@ class EnhancedFootballDataProcessor:
                 return []
         else:
             # Fallback to file system check
-            available_weeks = []
-            for week in range(1, 19):  # Check weeks 1-18
-                box_score_file = f"2025/WEEK{week}/box_score_debug.csv"
-                if os.path.exists(box_score_file):
-                    available_weeks.append(week)
-            return available_weeks
+            return list(self._discover_box_score_weeks())
     
     def close(self):
         """Close database connections"""
@@ -7,7 +7,9 @@ Infer positions based on what stat types each player has
 from database.database_manager import DatabaseManager
 from database.database_models import Prop
 from utils import clean_player_name
+from sqlalchemy import distinct, func
 import pandas as pd
+import numpy as np
 import os
 
 def generate_player_positions():
@@ -19,39 +21,33 @@ def generate_player_positions():
     db_manager = DatabaseManager()
     
     with db_manager.get_session() as session:
-        # Get all unique players and their stat types
-        players = session.query(Prop.player).distinct().all()
+        # Collect each player's distinct stat types in the database with one GROUP BY:
+        # array_agg on PostgreSQL, group_concat (comma-joined) elsewhere (SQLite)
+        if session.bind.dialect.name == 'postgresql':
+            stat_types_agg = func.array_agg(distinct(Prop.stat_type))
+        else:
+            stat_types_agg = func.group_concat(distinct(Prop.stat_type))
+        rows = session.query(Prop.player, stat_types_agg).group_by(Prop.player).all()
         
-        print(f"Found {len(players)} unique players in database")
+        print(f"Found {len(rows)} unique players in database")
         print()
         
-        player_positions = []
-        
-        for (player_name,) in players:
+        # One pass over the result set fills parallel player / stat type columns.
+        # Players with no stat type at all are kept (with an empty string).
+        players, stat_types_joined = [], []
+        for player_name, stat_types in rows:
             if not player_name:
                 continue
-            
-            # Get all stat types for this player
-            stats = session.query(Prop.stat_type).filter(
-                Prop.player == player_name
-            ).distinct().all()
-            
-            stat_types = [s[0] for s in stats if s[0]]
-            
-            # Infer position from stat types
-            position = infer_position(stat_types)
-            
-            cleaned_name = clean_player_name(player_name)
-            
-            player_positions.append({
-                'player': player_name,
-                'cleaned_name': cleaned_name,
-                'position': position,
-                'stat_types': ', '.join(stat_types)
-            })
+            if isinstance(stat_types, str):
+                stat_types = stat_types.split(',')
+            players.append(player_name)
+            stat_types_joined.append(', '.join(st for st in stat_types or [] if st))
         
-        # Create DataFrame
-        df = pd.DataFrame(player_positions)
+        # Create DataFrame column-wise, inferring positions for all players at once
+        df = pd.DataFrame({'player': players, 'stat_types': stat_types_joined}, dtype=object)
+        df['cleaned_name'] = df['player'].map(clean_player_name)  # clean_player_name is lru_cached
+        df['position'] = infer_positions(df['stat_types'])
+        df = df[['player', 'cleaned_name', 'position', 'stat_types']]
         
         # Sort by position and player name
         df = df.sort_values(['position', 'player'])
@@ -105,6 +101,23 @@ def infer_position(stat_types):
     # Unknown
     return 'UNKNOWN'
 
+def infer_positions(stat_types):
+    """
+    Vectorized infer_position over many players
+    
+    Args:
+        stat_types: Series of each player's stat types joined with ', '
+        
+    Returns:
+        Array of positions, using the same rules as infer_position
+    """
+    has_passing = stat_types.str.contains('Passing', regex=False)
+    has_rushing = stat_types.str.contains('Rushing', regex=False)
+    has_receiving = stat_types.str.contains('Receiving|Receptions', regex=True)
+    
+    # QB if any passing; RB if rushing (with or without receiving); WR if receiving only
+    return np.select([has_passing, has_rushing, has_receiving], ['QB', 'RB', 'WR'], default='UNKNOWN')
+
 if __name__ == "__main__":
     generate_player_positions()
 
@@ -14,12 +14,44 @@ Usage:
 import sys
 import os
 import argparse
+import shutil
 from datetime import datetime
-import glob
 
 # Add the current directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Main cache files in data/ (player and team stats are Parquet, NFL.com TD data is pickled)
+MAIN_CACHE_FILES = {
+    'player_season': 'player_season_cache.parquet',
+    'team_defensive': 'team_defensive_cache.parquet',
+    'nfl_defensive_td': 'nfl_defensive_td_cache.pkl'
+}
+
+# Directory in data/ holding one Parquet copy per week of 2025/WEEK*/box_score_debug.csv
+BOX_SCORE_PARQUET_DIR = 'box_score_parquet'
+
+# SQLite cache of the scraper's HTTP responses (requests_cache, see defensive_scraper.py)
+HTTP_CACHE_FILE = 'http_cache.sqlite'
+
+def scan_ranking_caches(data_dir):
+    """
+    List the historical defensive rankings caches (defensive_rankings_week*.pkl)
+    
+    Uses one os.scandir pass; each DirEntry caches its stat result, so callers
+    can read st_mtime without another stat call.
+    
+    Returns:
+        DirEntry objects sorted by file name
+    """
+    try:
+        with os.scandir(data_dir) as entries:
+            ranking_caches = [entry for entry in entries
+                              if entry.name.startswith('defensive_rankings_week') and entry.name.endswith('.pkl')
+                              and entry.is_file()]
+    except OSError:
+        return []
+    return sorted(ranking_caches, key=lambda entry: entry.name)
+
 def get_cache_status():
     """Get detailed cache status information"""
     
@@ -33,18 +65,19 @@ def get_cache_status():
         print("❌ Data directory not found")
         return
     
-    # Check main caches
-    cache_types = ['player_season', 'team_defensive', 'nfl_defensive_td']
+    # One clock reading for the whole report, so all ages are measured from the same moment
+    now = datetime.now()
     
+    # Check main caches
     print("Main Caches:")
     print("-" * 70)
     
-    for cache_type in cache_types:
-        cache_file = os.path.join(data_dir, f"{cache_type}_cache.pkl")
+    for cache_type, cache_name in MAIN_CACHE_FILES.items():
+        cache_file = os.path.join(data_dir, cache_name)
         
         if os.path.exists(cache_file):
             cache_time = datetime.fromtimestamp(os.path.getmtime(cache_file))
-            age_hours = (datetime.now() - cache_time).total_seconds() / 3600
+            age_hours = (now - cache_time).total_seconds() / 3600
             age_days = age_hours / 24
             
             # Simple validity check (age-based)
@@ -61,18 +94,18 @@ def get_cache_status():
     print()
     
     # Check historical defensive rankings caches
-    ranking_caches = glob.glob(os.path.join(data_dir, "defensive_rankings_week*.pkl"))
+    ranking_caches = scan_ranking_caches(data_dir)
     
     if ranking_caches:
         print("Historical Defensive Rankings Caches:")
         print("-" * 70)
         
-        for cache_file in sorted(ranking_caches):
-            cache_time = datetime.fromtimestamp(os.path.getmtime(cache_file))
-            age_hours = (datetime.now() - cache_time).total_seconds() / 3600
+        for entry in ranking_caches:
+            cache_time = datetime.fromtimestamp(entry.stat().st_mtime)
+            age_hours = (now - cache_time).total_seconds() / 3600
             
             # Extract week number from filename
-            week = cache_file.split('week')[1].replace('.pkl', '')
+            week = entry.name.split('week')[1].replace('.pkl', '')
             
             print(f"   Week {week:<2} | Age: {age_hours:5.1f} hours | Modified: {cache_time.strftime('%Y-%m-%d %H:%M:%S')}")
     else:
@@ -80,6 +113,39 @@ def get_cache_status():
         print("-" * 70)
         print("   No historical ranking caches found")
     
+    print()
+    
+    # Check Parquet copies of the weekly box score CSVs
+    print("Box Score Parquet Copies:")
+    print("-" * 70)
+    parquet_dir = os.path.join(data_dir, BOX_SCORE_PARQUET_DIR)
+    try:
+        with os.scandir(parquet_dir) as entries:
+            parquet_copies = sorted((entry for entry in entries if entry.name.endswith('.parquet')),
+                                    key=lambda entry: entry.name)
+    except OSError:
+        parquet_copies = []
+    
+    for entry in parquet_copies:
+        cache_time = datetime.fromtimestamp(entry.stat().st_mtime)
+        age_hours = (now - cache_time).total_seconds() / 3600
+        print(f"   {entry.name:<20} | Age: {age_hours:5.1f} hours | Modified: {cache_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    if not parquet_copies:
+        print("   No box score Parquet copies found")
+    
+    print()
+    
+    # Check the scraper's HTTP response cache
+    print("HTTP Response Cache:")
+    print("-" * 70)
+    http_cache_file = os.path.join(data_dir, HTTP_CACHE_FILE)
+    if os.path.exists(http_cache_file):
+        cache_time = datetime.fromtimestamp(os.path.getmtime(http_cache_file))
+        age_hours = (now - cache_time).total_seconds() / 3600
+        print(f"   {HTTP_CACHE_FILE:<20} | Age: {age_hours:5.1f} hours | Modified: {cache_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    else:
+        print("   No HTTP response cache found")
+    
     print()
     print("=" * 70)
 
@@ -95,10 +161,8 @@ def clear_all_caches():
         return
     
     # Clear main caches
-    cache_types = ['player_season', 'team_defensive', 'nfl_defensive_td']
-    
-    for cache_type in cache_types:
-        cache_file = os.path.join(data_dir, f"{cache_type}_cache.pkl")
+    for cache_type, cache_name in MAIN_CACHE_FILES.items():
+        cache_file = os.path.join(data_dir, cache_name)
         if os.path.exists(cache_file):
             os.remove(cache_file)
             print(f"✅ Removed {cache_type} cache")
@@ -106,16 +170,37 @@ def clear_all_caches():
             print(f"ℹ️  {cache_type} cache not found")
     
     # Clear historical defensive rankings caches
-    ranking_caches = glob.glob(os.path.join(data_dir, "defensive_rankings_week*.pkl"))
+    ranking_caches = scan_ranking_caches(data_dir)
     
-    for cache_file in ranking_caches:
-        week = cache_file.split('week')[1].replace('.pkl', '')
-        os.remove(cache_file)
+    if ranking_caches:
+        # Unlink the week files concurrently so the removals overlap on slow filesystems
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(ranking_caches))) as executor:
+            list(executor.map(os.remove, [entry.path for entry in ranking_caches]))
+    
+    for entry in ranking_caches:
+        week = entry.name.split('week')[1].replace('.pkl', '')
         print(f"✅ Removed defensive_rankings_week{week} cache")
     
     if not ranking_caches:
         print("ℹ️  No historical ranking caches found")
     
+    # Clear Parquet copies of the weekly box score CSVs
+    parquet_dir = os.path.join(data_dir, BOX_SCORE_PARQUET_DIR)
+    if os.path.isdir(parquet_dir):
+        shutil.rmtree(parquet_dir)
+        print("✅ Removed box score Parquet copies")
+    else:
+        print("ℹ️  No box score Parquet copies found")
+    
+    # Clear the scraper's HTTP response cache
+    http_cache_file = os.path.join(data_dir, HTTP_CACHE_FILE)
+    if os.path.exists(http_cache_file):
+        os.remove(http_cache_file)
+        print("✅ Removed HTTP response cache")
+    else:
+        print("ℹ️  No HTTP response cache found")
+    
     print()
     print("✅ All caches cleared. Data will be rebuilt on next access.")
 
@@ -244,13 +244,10 @@ class OddsAPI:
                 team = data_processor.get_player_team(cleaned_name)
                 if team == "Unknown":
                     # Try case-insensitive matching with name cleaning on both sides
-                    if hasattr(data_processor, 'player_season_stats'):
-                        for stored_player, stats in data_processor.player_season_stats.items():
-                            # Clean both names for comparison
-                            cleaned_stored = clean_player_name(stored_player)
-                            if cleaned_stored.lower() == cleaned_name.lower():
-                                team = stats.get('team', 'Unknown')
-                                break
+                    if hasattr(data_processor, 'get_player_key_case_insensitive'):
+                        stored_player = data_processor.get_player_key_case_insensitive(cleaned_name)
+                        if stored_player:
+                            team = data_processor.player_season_stats[stored_player].get('team', 'Unknown')
             
             # Normalize team name from abbreviation to full name
             if team != "Unknown" and team in self.team_name_mapping:
@@ -148,12 +148,15 @@ def process_props_and_score(props_df, stat_types_in_data, scorer, data_processor
     if props_df.empty:
         return all_props
     
+    # Partition props by stat type in one pass instead of one boolean mask per stat type
+    props_by_stat_type = {stat_type: group for stat_type, group in props_df.groupby('Stat Type', sort=False)}
+    
     if fallback_used:
         # Database mode: process all rows (already includes alternates)
         for idx, stat_type in enumerate(stat_types_in_data):
-            stat_filtered_df = props_df[props_df['Stat Type'] == stat_type].copy()
+            stat_filtered_df = props_by_stat_type.get(stat_type)
             
-            if stat_filtered_df.empty:
+            if stat_filtered_df is None or stat_filtered_df.empty:
                 continue
             
             if progress_bar:
@@ -161,6 +164,10 @@ def process_props_and_score(props_df, stat_types_in_data, scorer, data_processor
                 progress_val = 50 + int((idx + 1) / len(stat_types_in_data) * 40)
                 progress_bar.progress(progress_val, text=progress_text)
             
+            # OPTIMIZATION: Season over rates for the whole stat type in one batch
+            scorer.prefetch_season_over_rates(stat_type, stat_filtered_df['Player'].tolist(),
+                                              stat_filtered_df['Line'].tolist())
+            
             # Process all rows from database (both main and alternate lines)
             for _, row in stat_filtered_df.iterrows():
                 try:
@@ -195,15 +202,19 @@ def process_props_and_score(props_df, stat_types_in_data, scorer, data_processor
         # API mode (OPTIMIZED): All props come from alternate lines
         # No main props are fetched to save API calls
         for idx, stat_type in enumerate(stat_types_in_data):
-            stat_filtered_df = props_df[props_df['Stat Type'] == stat_type].copy()
+            stat_filtered_df = props_by_stat_type.get(stat_type)
             
-            if stat_filtered_df.empty:
+            if stat_filtered_df is None or stat_filtered_df.empty:
                 continue
             
             progress_text = f"Processing {stat_type}... ({idx+1}/{len(stat_types_in_data)})"
             progress_val = 50 + int((idx + 1) / len(stat_types_in_data) * 40)
             progress_bar.progress(progress_val, text=progress_text)
             
+            # OPTIMIZATION: Season over rates for the whole stat type in one batch
+            scorer.prefetch_season_over_rates(stat_type, stat_filtered_df['Player'].tolist(),
+                                              stat_filtered_df['Line'].tolist())
+            
             # Process all props (which are all alternates with odds filter)
             for _, row in stat_filtered_df.iterrows():
                 # Filter odds between +200 and -450
@@ -845,14 +856,8 @@ def calculate_high_score_straight_bets_roi():
             
             # Score all props
             all_props = []
-            stat_types_in_data = props_df['Stat Type'].unique()
-            
-            for stat_type in stat_types_in_data:
-                stat_filtered_df = props_df[props_df['Stat Type'] == stat_type].copy()
-                
-                if stat_filtered_df.empty:
-                    continue
-                
+            # Partition once by stat type (groupby keeps first-appearance order)
+            for stat_type, stat_filtered_df in props_df.groupby('Stat Type', sort=False):
                 for _, row in stat_filtered_df.iterrows():
                     score_data = scorer_historical.calculate_comprehensive_score(
                         row['Player'],
@@ -2289,7 +2294,9 @@ def main():
                     game_labels.append(label.strip())
                 
                 # Determine bar colors based on whether they hit the line
-                bar_colors = ['#2ecc71' if val > line else '#e74c3c' for val in game_values]
+                # (compared once; also reused for the hit count below)
+                is_over = [val > line for val in game_values]
+                bar_colors = ['#2ecc71' if over else '#e74c3c' for over in is_over]
                 
                 fig = go.Figure()
                 
@@ -2341,7 +2348,7 @@ def main():
                 st.plotly_chart(fig, use_container_width=True, key=f"chart_{player_name}_{stat_type}")
                 
                 # Add context info
-                over_count = sum(1 for val in game_values if val > line)
+                over_count = sum(is_over)
                 st.caption(f"🟢 Hit Over: {over_count}/{len(game_values)} games • 🔴 Hit Under: {len(game_values) - over_count}/{len(game_values)} games • Defensive ranks in parentheses • Dates shown as MM/DD")
             else:
                 st.info(f"No game history available for {player_name} - {stat_type}")
@@ -5,6 +5,7 @@ and provides position-aware defensive rankings.
 """
 
 import pandas as pd
+import numpy as np
 import os
 import json
 from typing import Dict, Optional, Tuple, List
@@ -359,7 +360,7 @@ class PositionDefensiveRankings:
                     self.position_defensive_stats[team] = {'Games_Played': 0}
                 self.position_defensive_stats[team]['Games_Played'] += 1
             
-            df = pd.read_csv(box_score_path)
+            df = pd.read_csv(box_score_path, engine='pyarrow')
             print(f"  Processing {len(df)} players from box score")
             
             players_processed = 0
@@ -550,38 +551,45 @@ class PositionDefensiveRankings:
         for team_stats in self.position_defensive_stats.values():
             all_position_stats.update(team_stats.keys())
         
-        # Calculate rankings for each position stat (per-game basis)
+        # Calculate rankings for each position stat (per-game basis).
+        # OPTIMIZATION: Flatten every team's per-game value lists into one array, total
+        # them with a single reduceat and rank each stat with a groupby instead of
+        # summing and sorting list by list in Python.
+        stat_names, team_names, games_played, value_lists = [], [], [], []
         for position_stat in all_position_stats:
-            team_values = {}
-            
             for team, stats in self.position_defensive_stats.items():
                 if position_stat in stats:
                     yards_list = stats[position_stat]
-                    games_played = stats.get('Games_Played', 1)  # Default to 1 to avoid division by zero
-                    
-                    # Calculate average per game (sum of all yards / games played)
-                    if isinstance(yards_list, list) and yards_list:
-                        total_yards = sum(yards_list)
-                        per_game_yards = total_yards / games_played
-                    else:
-                        per_game_yards = 0
-                    
-                    team_values[team] = per_game_yards
-            
-            if not team_values:
-                continue
-            
-            # Sort teams by value (lower values = better defense = lower rank)
-            # For yards allowed: lower is better (rank 1 = best defense)
-            # For TDs allowed: lower is better (rank 1 = best defense)
-            sorted_teams = sorted(team_values.items(), key=lambda x: x[1], reverse=False)
-            
-            # Create ranking (1 = best defense, higher number = worse defense)
-            rankings = {}
-            for rank, (team, value) in enumerate(sorted_teams, 1):
-                rankings[team] = rank
-            
-            self.position_defensive_rankings[position_stat] = rankings
+                    stat_names.append(position_stat)
+                    team_names.append(team)
+                    games_played.append(stats.get('Games_Played', 1))  # Default to 1 to avoid division by zero
+                    # Non-list entries (and empty lists) count as 0 per game
+                    value_lists.append(yards_list if isinstance(yards_list, list) else [])
+        
+        if not stat_names:
+            return
+        
+        lengths = np.fromiter(map(len, value_lists), dtype=np.int64, count=len(value_lists))
+        all_values = np.fromiter((value for values in value_lists for value in values),
+                                 dtype=float, count=int(lengths.sum()))
+        totals = np.zeros(len(value_lists))
+        has_values = lengths > 0
+        if has_values.any():
+            # Empty lists are skipped so reduceat only sees non-empty segments
+            starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            totals[has_values] = np.add.reduceat(all_values, starts[has_values])
+        
+        # Calculate average per game (sum of all yards / games played)
+        per_game = pd.DataFrame({'stat': stat_names, 'team': team_names,
+                                 'per_game': totals / np.asarray(games_played, dtype=float)})
+        
+        # Lower values = better defense = lower rank (rank 1 = best defense) for both
+        # yards and TDs allowed; equal values keep team order, like a stable sort
+        per_game['rank'] = per_game.groupby('stat', sort=False)['per_game'].rank(method='first').astype(int)
+        
+        for position_stat, group in per_game.groupby('stat', sort=False):
+            ranked = group.sort_values('rank')
+            self.position_defensive_rankings[position_stat] = dict(zip(ranked['team'], ranked['rank'].tolist()))
     
     def get_position_defensive_rank(self, team: str, player_name: str, stat_type: str) -> Optional[int]:
         """
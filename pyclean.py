@@ -14,6 +14,7 @@ import sys
 import os
 import argparse
 import glob
+import shutil
 
 # Add the current directory to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -31,11 +32,15 @@ def pyclean():
     
     cleared_count = 0
     
-    # Clear main caches
-    cache_types = ['player_season', 'team_defensive', 'nfl_defensive_td']
+    # Clear main caches (player and team stats are Parquet, NFL.com TD data is pickled)
+    cache_files = {
+        'player_season': 'player_season_cache.parquet',
+        'team_defensive': 'team_defensive_cache.parquet',
+        'nfl_defensive_td': 'nfl_defensive_td_cache.pkl'
+    }
     
-    for cache_type in cache_types:
-        cache_file = os.path.join(data_dir, f"{cache_type}_cache.pkl")
+    for cache_type, cache_name in cache_files.items():
+        cache_file = os.path.join(data_dir, cache_name)
         if os.path.exists(cache_file):
             os.remove(cache_file)
             print(f"✅ Cleared {cache_type} cache")
@@ -50,10 +55,23 @@ def pyclean():
         print(f"✅ Cleared defensive_rankings_week{week} cache")
         cleared_count += 1
     
+    # Clear Parquet copies of the weekly box score CSVs
+    parquet_dir = os.path.join(data_dir, "box_score_parquet")
+    if os.path.isdir(parquet_dir):
+        shutil.rmtree(parquet_dir)
+        print("✅ Cleared box score Parquet copies")
+        cleared_count += 1
+    
+    # Clear the scraper's HTTP response cache
+    http_cache_file = os.path.join(data_dir, "http_cache.sqlite")
+    if os.path.exists(http_cache_file):
+        os.remove(http_cache_file)
+        print("✅ Cleared HTTP response cache")
+        cleared_count += 1
+    
     # Clear Streamlit cache directory if it exists
     streamlit_cache_dir = os.path.expanduser("~/.streamlit/cache")
     if os.path.exists(streamlit_cache_dir):
-        import shutil
         shutil.rmtree(streamlit_cache_dir)
         print("✅ Cleared Streamlit cache directory")
         cleared_count += 1
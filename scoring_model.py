@@ -14,6 +14,27 @@ class AdvancedPropScorer:
         self.data_processor = data_processor
         # Cache player statistics to avoid recalculating for every prop
         self._player_stats_cache = {}
+        # Season over rates computed ahead of time for a whole slate (see prefetch_season_over_rates)
+        self._season_over_rate_cache = {}
+        
+    def prefetch_season_over_rates(self, stat_type: str, players: List[str], lines: List[float]):
+        """
+        OPTIMIZATION: Compute season over rates for every (player, line) of a stat type in one pass
+        
+        Args:
+            stat_type: Type of stat (e.g., "Passing Yards")
+            players: Player names
+            lines: Line for each player (same length as players)
+        """
+        try:
+            over_rates = self.data_processor.get_player_over_rates_batch(stat_type, players, lines)
+        except (TypeError, ValueError) as e:
+            # Non-numeric lines: leave these props to the per-prop calculation
+            print(f"⚠️ Could not batch over rates for {stat_type}: {e}")
+            return
+        
+        for player, line, over_rate in zip(players, lines, over_rates):
+            self._season_over_rate_cache[(player, stat_type, line)] = over_rate
         
     def calculate_comprehensive_score(self, 
                                     player: str, 
@@ -73,7 +94,10 @@ class AdvancedPropScorer:
             player_streak = cached_stats['player_streak']
         else:
             # Calculate and cache (raw values, may be None)
-            season_over_rate_raw = self.data_processor.get_player_over_rate(player, stat_type, line)
+            if cache_key in self._season_over_rate_cache:
+                season_over_rate_raw = self._season_over_rate_cache[cache_key]
+            else:
+                season_over_rate_raw = self.data_processor.get_player_over_rate(player, stat_type, line)
             l5_over_rate_raw = self.data_processor.get_player_last_n_over_rate(player, stat_type, line, n=5)
             home_over_rate = self.data_processor.get_player_home_over_rate(player, stat_type, line)
             away_over_rate = self.data_processor.get_player_away_over_rate(player, stat_type, line)
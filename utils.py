@@ -5,6 +5,7 @@ Includes player name cleaning, team name normalization, week detection, and form
 
 import re
 import pandas as pd
+from functools import lru_cache
 from datetime import datetime
 from typing import Dict, Optional
 import os
@@ -235,6 +236,9 @@ class TeamNameNormalizer:
         'Washington Commanders': 'WAS',
     }
     
+    # Case-insensitive lookup table for normalize() (lowercased variations never collide)
+    TEAM_NAME_MAPPING_LOWER = {key.lower(): value for key, value in TEAM_NAME_MAPPING.items()}
+    
     # 2025 NFL Bye Week Schedule
     # Each team has exactly one bye week during the season (weeks 5-14)
     # Use this to understand gaps in player stats and avoid confusion
@@ -293,9 +297,8 @@ class TeamNameNormalizer:
         
         # Try case-insensitive match
         team_name_lower = team_name.lower()
-        for key, value in cls.TEAM_NAME_MAPPING.items():
-            if key.lower() == team_name_lower:
-                return value
+        if team_name_lower in cls.TEAM_NAME_MAPPING_LOWER:
+            return cls.TEAM_NAME_MAPPING_LOWER[team_name_lower]
         
         # Try partial match (for cases like "SF 49ers" or "49ers SF")
         for key, value in cls.TEAM_NAME_MAPPING.items():
@@ -509,6 +512,20 @@ def get_available_weeks(year: str = "2025") -> list[int]:
     return sorted(NFL_2025_WEEK_DATES.keys())
 
 
+@lru_cache(maxsize=1)
+def _week_start_dates_et() -> tuple:
+    """
+    Parse NFL_2025_WEEK_DATES once into (week, start datetime in Eastern Time) pairs
+    
+    Returns:
+        Tuple of (week number, localized start datetime), sorted by week
+    """
+    import pytz
+    eastern = pytz.timezone('US/Eastern')
+    return tuple((week, eastern.localize(datetime.strptime(NFL_2025_WEEK_DATES[week], '%Y-%m-%d')))
+                 for week in sorted(NFL_2025_WEEK_DATES))
+
+
 def get_current_week_from_dates(year: str = "2025") -> int:
     """
     Determine the current NFL week based on week start dates and today's date
@@ -529,20 +546,12 @@ def get_current_week_from_dates(year: str = "2025") -> int:
     today_et = datetime.now(eastern).replace(hour=0, minute=0, second=0, microsecond=0)
     
     # Find which week we're in based on start dates
-    weeks = sorted(NFL_2025_WEEK_DATES.keys())
+    week_starts = _week_start_dates_et()
     
-    for i, week in enumerate(weeks):
-        week_start_str = NFL_2025_WEEK_DATES[week]
-        week_start = datetime.strptime(week_start_str, '%Y-%m-%d')
-        # Convert to Eastern Time
-        week_start_et = eastern.localize(week_start)
-        
+    for i, (week, week_start_et) in enumerate(week_starts):
         # Get next week's start date (or add 7 days if it's the last week)
-        if i + 1 < len(weeks):
-            next_week_start_str = NFL_2025_WEEK_DATES[weeks[i + 1]]
-            next_week_start = datetime.strptime(next_week_start_str, '%Y-%m-%d')
-            # Convert to Eastern Time
-            next_week_start_et = eastern.localize(next_week_start)
+        if i + 1 < len(week_starts):
+            next_week_start_et = week_starts[i + 1][1]
         else:
             # Last week - use 7 days as the range
             from datetime import timedelta
@@ -553,7 +562,7 @@ def get_current_week_from_dates(year: str = "2025") -> int:
             return week
     
     # If we're past all weeks, return the last week + 1
-    return weeks[-1] + 1
+    return week_starts[-1][0] + 1
 
 
 # ============================================================================
@@ -589,7 +598,7 @@ def get_current_week_from_schedule(schedule_file="2025/nfl_schedule.csv"):
     
     try:
         # Load schedule
-        schedule = pd.read_csv(schedule_file)
+        schedule = pd.read_csv(schedule_file, engine='pyarrow')
         
         # Parse dates - handle "Sep 4 2025" format
         schedule['parsed_date'] = pd.to_datetime(
@@ -707,6 +716,7 @@ def get_available_weeks_with_data():
 # PLAYER NAME CLEANING
 # ============================================================================
 
+@lru_cache(maxsize=8192)
 def clean_player_name(name: str) -> str:
     """
     Comprehensive player name cleaning function that handles:
@@ -719,6 +729,9 @@ def clean_player_name(name: str) -> str:
         
     Returns:
         str: Cleaned and standardized player name
+        
+    Results are memoized: the same few hundred names are cleaned over and
+    over across week loads and player lookups.
     """
     if pd.isna(name) or not name:
         return ""